@@ -6,24 +6,95 @@ supported, but is generally not tested, and may not produce expected results.
 
 The module usually expects data to be stored in xarray `DataArray` or `Dataset`
 objects.
+
+holoviews is imported inside the plotting functions rather than at module
+level, since importing it is slow, and importing this module should not be.
 """
 from __future__ import annotations
 import typing as tp
 import dataclasses
+import functools
+import operator
 
-import holoviews as hv
-import matplotlib as mplt
+import numpy as np
 import xarray as xr
 
+if tp.TYPE_CHECKING:
+    import holoviews as hv
 
 # Define convenience types
 XrData: tp.TypeAlias = tp.Union[xr.DataArray, xr.Dataset]
 XrDataTypeVar = tp.TypeVar('XrDataTypeVar', bound=XrData)
 NumType: tp.TypeAlias = tp.Union[int, float]
-HvOptsType: tp.TypeAlias = tp.Union[tp.Mapping[str, tp.Any], hv.Options]
+HvOptsType: tp.TypeAlias = tp.Union[tp.Mapping[str, tp.Any], 'hv.Options']
 HvColor: tp.TypeAlias = tp.Union[str, tp.Tuple[float, float, float]]
 
 
+DEFAULT_MPLT_LEGEND_OPTS: tp.Mapping[str, tp.Any] = dict(
+    loc='upper left',
+    bbox_to_anchor=(1.05, 1.0),
+    title_fontsize=0,
+    frameon=False
+)
+"""Default matplotlib legend options. Values passed through the
+`legend_opts` parameter of the plotting functions are applied on top of
+these."""
+
+
+def _prepend_total(
+    plotdata: xr.Dataset,
+    y: tp.Hashable,
+    dim: tp.Hashable,
+    total_code: tp.Hashable
+) -> xr.Dataset:
+    """Adds the sum of `plotdata[y]` over `dim` as the first element of `dim`.
+
+    The total and the original values are written into a single preallocated
+    array, rather than expanding the total and concatenating it with
+    `xarray.concat`, which would need an extra alignment pass and copy. `dim`
+    is made the first dimension of the returned variable, and the total gets
+    the coordinate value `total_code`. Only `y` and any variables that do not
+    depend on `dim` are kept in the returned Dataset.
+    """
+    y_arr: xr.DataArray = plotdata[y].transpose(dim, ...)
+    total_values: np.ndarray = y_arr.sum(dim=dim).to_numpy()
+    y_values: np.ndarray = y_arr.to_numpy()
+    new_values: np.ndarray = np.empty(
+        shape=(y_values.shape[0] + 1,) + total_values.shape,
+        dtype=np.result_type(total_values, y_values)
+    )
+    new_values[0] = total_values
+    new_values[1:] = y_values
+    new_coords: tp.Dict[tp.Hashable, tp.Any] = {
+        _name: _coord for _name, _coord in y_arr.coords.items()
+        if dim not in _coord.dims
+    }
+    new_coords[dim] = [total_code] + y_arr.indexes[dim].tolist()
+    total_arr: xr.DataArray = xr.DataArray(
+        data=new_values,
+        dims=y_arr.dims,
+        coords=new_coords,
+        attrs=y_arr.attrs
+    )
+    return plotdata.drop_dims(dim).assign({y: total_arr})
+###END def _prepend_total
+
+
+@functools.lru_cache(maxsize=128)
+def _hue_dimension(
+    name: tp.Hashable,
+    values: tp.Tuple[tp.Hashable, ...]
+) -> hv.Dimension:
+    """Returns a holoviews Dimension named `name` with explicit `values`.
+
+    The result is cached on `name` and `values`, so the Dimension objects are
+    shared between plots and must not be modified.
+    """
+    import holoviews as hv
+    return hv.Dimension(name, values=list(values))
+###END def _hue_dimension
+
+
 def plot_lines(
     plotdata: XrData,
     x: tp.Hashable,
@@ -49,6 +120,7 @@ def plot_lines(
     aspect: float = 1.5
 ) -> tp.Union[hv.NdOverlay, hv.Curve]:
     """Creates a line plot, with optionally overlaid lines."""
+    import holoviews as hv
 
     # Make plotdata a Dataset if it isn't one already. If it is, make sure
     # that `y` is specified, since there is no `name` attribute to infer it
@@ -56,7 +128,7 @@ def plot_lines(
     if isinstance(plotdata, xr.DataArray):
         y = plotdata.name
         plotdata = plotdata.to_dataset()
-    elif isinstance(y, xr.Dataset):
+    elif isinstance(plotdata, xr.Dataset):
         if y is None:
             raise ValueError(
                 '`y` must be specified when plotdata is an xarray.Dataset.'
@@ -72,17 +144,11 @@ def plot_lines(
             add_total_dim: tp.Hashable = hue
         else:
             add_total_dim = add_total
-        total_arr: xr.DataArray = plotdata[y].sum(
+        plotdata = _prepend_total(
+            plotdata,
+            y=y,
             dim=add_total_dim,
-            keep_attrs=True
-        ).expand_dims(
-            dim={
-                add_total_dim: [total_code]
-            }
-        )
-        plotdata = xr.concat(
-            objs=[total_arr.to_dataset(), plotdata],
-            dim=add_total_dim
+            total_code=total_code
         )
 
         # If the hue dim is the one being summed over and legend labels are
@@ -90,13 +156,9 @@ def plot_lines(
         # to the *beginning*, since it will usually be greater than any of the
         # individual lines.
         if legend_labels and add_total_dim == hue:
-            # Create legend_labels from scratch, to put the total label first
-            legend_labels = {
-                _key: _value for _key, _value in zip(
-                    [total_code] + list(legend_labels.keys()),
-                    [total_label] + list(legend_labels.values())
-                )
-            }
+            # Create a new legend_labels dict with the total label inserted
+            # first (dicts preserve insertion order)
+            legend_labels = {total_code: total_label, **legend_labels}
 
     # If legend labels are specified, rename the dimension values to match,
     # since the legend apparently will display dimension coordinate values.
@@ -104,101 +166,101 @@ def plot_lines(
     # appear to work for the matplotlib extension (has no effect), as of
     # 2023-01-30, holoviews version 1.15.4.
     if legend_labels and hue in plotdata.dims:
-        legend_label_coords, legend_label_values = \
-            zip(*(legend_labels.items()))
-        legend_labels_arr = xr.DataArray(
-            data=list(legend_label_values),
-            dims=(hue,),
-            coords={
-                hue: list(legend_label_coords)
-            }
-        )
-        plotdata_origindex = plotdata.copy(deep=False)
-        plotdata = plotdata.reindex_like(legend_labels_arr)
+        # Select the hue values in the order given by `legend_labels` (a plain
+        # positional gather, no alignment needed since the values are already
+        # present), then swap in the labels as new coordinate values.
+        plotdata = plotdata.sel({hue: list(legend_labels.keys())})
         plotdata = plotdata.assign_coords(
             {
-                hue: legend_labels_arr
+                hue: list(legend_labels.values())
             }
         )
         # Since we have changed the dimension coordinate values of the hue
         # dimension, we also need to change the colormap keys accordingly
         if colormap:
             colormap = {
-                _newkey: colormap[_oldkey] for _oldkey, _newkey in zip(
-                    legend_label_coords,
-                    legend_label_values
-                )
+                _newkey: colormap[_oldkey]
+                for _oldkey, _newkey in legend_labels.items()
             }
 
-    # Create the holoviews Dataset to use for plotting
-    hvds: hv.Dataset = hv.Dataset(
-        data=plotdata,
-        kdims=[x, hue],
-        vdims=[y]
-    )
-
     # Explicitly set values for the hue dimension, to ensure that it does not get
-    # alphabetically sorted in the overlays and legends.
-    hue_dim: hv.Dimension = hvds.get_dimension(hue)
+    # alphabetically sorted in the overlays and legends. The values are read
+    # directly from the coordinate variable, to avoid wrapping it in a new
+    # DataArray just to get at the values. The dimension is created up front
+    # by a cached factory function, so that repeated plots with the same hue
+    # values reuse the same Dimension object.
+    hue_values: tp.Tuple[tp.Hashable, ...]
     if legend_labels:
-        hue_dim.values = list(legend_labels.values())
+        hue_values = tuple(legend_labels.values())
     else:
-        hue_dim.values = plotdata[hue].to_numpy().tolist()
+        hue_values = tuple(plotdata.variables[hue].values.tolist())
+    hue_dim: hv.Dimension = _hue_dimension(hue, hue_values)
+
+    # Create the holoviews Dataset to use for plotting. Only `y` is passed
+    # on, so that other data variables are not scanned by holoviews.
+    hvds: hv.Dataset = hv.Dataset(
+        data=plotdata[[y]],
+        kdims=[x, hue_dim],
+        vdims=[y]
+    )
 
     # Define curve and point elements to be overlaid, and create a raw figure
-    # object (NdOverlay) before applying matplotlib styling options.
+    # object (NdOverlay) before applying matplotlib styling options. The
+    # points are made by converting each of the curves, rather than by
+    # calling `hvds.to` a second time, so that the data only gets grouped by
+    # the hue dimension once.
     curves: hv.HoloMap = hvds.to(hv.Curve, kdims=x)
-    points: hv.HoloMap = hvds.to(hv.Scatter, kdims=x)
+    points: hv.HoloMap = curves.map(hv.Scatter, hv.Curve)
     raw_fig: hv.Overlay = (curves*points).overlay(hue)
 
     # Set color options if needed
     colorlist: tp.List[HvColor]
     colorcycle: tp.Optional[hv.Cycle]
     if colormap:
-        _huedimval: HvColor
-        colorlist = [
-            colormap[_huedimval] for _huedimval in hue_dim.values
-        ]
+        # `itemgetter` returns a single value rather than a tuple when given a
+        # single key, so that case needs to be handled separately.
+        if len(hue_dim.values) == 1:
+            colorlist = [colormap[hue_dim.values[0]]]
+        else:
+            colorlist = list(operator.itemgetter(*hue_dim.values)(colormap))
         colorcycle = hv.Cycle(colorlist)
         raw_fig = tp.cast(hv.Overlay, raw_fig.options(
             hv.opts.Curve(color=colorcycle),
             hv.opts.Scatter(color=colorcycle)
         ))
 
-    # Set matplotlib options. First set defaults, then update with the
-    # legend_opts parameter if set.
-    mplt_legend_opts: tp.Dict[str, tp.Any] = dict(
-        loc='upper left',
-        bbox_to_anchor=(1.05, 1.0),
-        title_fontsize=0,
-        frameon=False
-    )
-    if legend_opts:
-        mplt_legend_opts.update(legend_opts)
-
-    # Set default matplotlib options. First define a dict, then remove None-
-    # valued items, to avoid passing None values to hv.opts.NdOverlay
-    default_opts_dict: tp.Dict[str, tp.Any] = dict(
-        aspect=aspect,
-        fig_size=fig_size,
-        xlim=xlim,
-        ylim=ylim,
-        xlabel=xlabel,
-        ylabel=ylabel,
-        xticks=xticks,
-        yticks=yticks,
-        legend_opts=mplt_legend_opts
-    )
-    for _key, _val in default_opts_dict.copy().items():
-        if _val is None:
-            del default_opts_dict[_key]
-    mplt_opts: tp.Sequence[HvOptsType] = [
-        hv.opts.NdOverlay(**default_opts_dict)
-    ]
+    # Set matplotlib options. Start from the module-level defaults, updated
+    # with the legend_opts parameter if set.
+    mplt_legend_opts: tp.Dict[str, tp.Any] = {
+        **DEFAULT_MPLT_LEGEND_OPTS,
+        **(legend_opts or {})
+    }
+
+    # Set default matplotlib options. Leave out None-valued items, to avoid
+    # passing None values to hv.opts.NdOverlay
+    default_opts_dict: tp.Dict[str, tp.Any] = {
+        _key: _val for _key, _val in (
+            ('aspect', aspect),
+            ('fig_size', fig_size),
+            ('xlim', xlim),
+            ('ylim', ylim),
+            ('xlabel', xlabel),
+            ('ylabel', ylabel),
+            ('xticks', xticks),
+            ('yticks', yticks),
+            ('legend_opts', mplt_legend_opts)
+        ) if _val is not None
+    }
+    # Only make a list of options if custom `opts` have been given, otherwise
+    # pass the NdOverlay options object directly
+    ndoverlay_opts: hv.Options = hv.opts.NdOverlay(**default_opts_dict)
+    mplt_opts: tp.Union[HvOptsType, tp.List[HvOptsType]]
     if opts:
         if not isinstance(opts, tp.Sequence):
             opts = [opts]
-        mplt_opts.extend(opts)
+        mplt_opts = [ndoverlay_opts, *opts]
+    else:
+        mplt_opts = ndoverlay_opts
 
     ret_fig: hv.NdOverlay = tp.cast(hv.NdOverlay, raw_fig.options(mplt_opts))
 
@@ -232,14 +294,13 @@ def plot_bar_stacked(
     aspect: float = 1.5
 ) -> tp.Union[hv.NdOverlay, hv.Curve]:
     """Creates a stacked bar plot, with optional dot showing the total."""
-
     # Make plotdata a Dataset if it isn't one already. If it is, make sure
     # that `y` is specified, since there is no `name` attribute to infer it
     # from
     if isinstance(plotdata, xr.DataArray):
         y = plotdata.name
         plotdata = plotdata.to_dataset()
-    elif isinstance(y, xr.Dataset):
+    elif isinstance(plotdata, xr.Dataset):
         if y is None:
             raise ValueError(
                 '`y` must be specified when plotdata is an xarray.Dataset.'
@@ -255,17 +316,11 @@ def plot_bar_stacked(
             add_total_dim: tp.Hashable = hue
         else:
             add_total_dim = add_total
-        total_arr: xr.DataArray = plotdata[y].sum(
+        plotdata = _prepend_total(
+            plotdata,
+            y=y,
             dim=add_total_dim,
-            keep_attrs=True
-        ).expand_dims(
-            dim={
-                add_total_dim: [total_code]
-            }
-        )
-        plotdata = xr.concat(
-            objs=[total_arr.to_dataset(), plotdata],
-            dim=add_total_dim
+            total_code=total_code
         )
 
         # If the hue dim is the one being summed over and legend labels are
@@ -273,13 +328,9 @@ def plot_bar_stacked(
         # to the *beginning*, since it will usually be greater than any of the
         # individual lines.
         if legend_labels and add_total_dim == hue:
-            # Create legend_labels from scratch, to put the total label first
-            legend_labels = {
-                _key: _value for _key, _value in zip(
-                    [total_code] + list(legend_labels.keys()),
-                    [total_label] + list(legend_labels.values())
-                )
-            }
+            # Create a new legend_labels dict with the total label inserted
+            # first (dicts preserve insertion order)
+            legend_labels = {total_code: total_label, **legend_labels}
 
     # If legend labels are specified, rename the dimension values to match,
     # since the legend apparently will display dimension coordinate values.
@@ -287,30 +338,21 @@ def plot_bar_stacked(
     # appear to work for the matplotlib extension (has no effect), as of
     # 2023-01-30, holoviews version 1.15.4.
     if legend_labels and hue in plotdata.dims:
-        legend_label_coords, legend_label_values = \
-            zip(*(legend_labels.items()))
-        legend_labels_arr = xr.DataArray(
-            data=list(legend_label_values),
-            dims=(hue,),
-            coords={
-                hue: list(legend_label_coords)
-            }
-        )
-        plotdata_origindex = plotdata.copy(deep=False)
-        plotdata = plotdata.reindex_like(legend_labels_arr)
+        # Select the hue values in the order given by `legend_labels` (a plain
+        # positional gather, no alignment needed since the values are already
+        # present), then swap in the labels as new coordinate values.
+        plotdata = plotdata.sel({hue: list(legend_labels.keys())})
         plotdata = plotdata.assign_coords(
             {
-                hue: legend_labels_arr
+                hue: list(legend_labels.values())
             }
         )
         # Since we have changed the dimension coordinate values of the hue
         # dimension, we also need to change the colormap keys accordingly
         if colormap:
             colormap = {
-                _newkey: colormap[_oldkey] for _oldkey, _newkey in zip(
-                    legend_label_coords,
-                    legend_label_values
-                )
+                _newkey: colormap[_oldkey]
+                for _oldkey, _newkey in legend_labels.items()
             }
 
     ###
@@ -349,13 +391,8 @@ def plot_bar_stacked(
             color=hue,
             color_discrete_map=colormap
         )
-        bar_data: xr.DataArray = plotdata[y].sel(
-            {
-                add_total_dim: [
-                    _coord for _coord in plotdata[add_total_dim].to_numpy()
-                    if _coord != total_id
-                ]
-            }
+        bar_data: xr.DataArray = plotdata[y].drop_sel(
+            {add_total_dim: [total_id]}
         )
     else:
         bar_data = plotdata[y]
@@ -399,6 +436,8 @@ def plot_bar_stacked(
 
     return bar_fig
 
+    import holoviews as hv
+
     # Create the holoviews Dataset to use for plotting
     hvds: hv.Dataset = hv.Dataset(
         data=plotdata,
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 import typing as tp
+import sys
+import dataclasses
 
-import pydantic
 
+# `dataclasses.dataclass` only accepts `slots` from Python 3.10 on.
+_DATACLASS_SLOTS: tp.Dict[str, bool] = \
+    {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class CachedData(pydantic.BaseModel):
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class CachedData:
     """Empty base class for classes storing cached data"""
     pass
 ###END class Cached Data
@@ -3,6 +3,10 @@
 from __future__ import annotations
 import typing as tp
 from pathlib import Path
+import os
+import sys
+import functools
+import dataclasses
 
 import pandas as pd
 import pydantic
@@ -11,20 +15,94 @@ from . import helpers
 from . import yamlfuncs
 
 
-class DescriptorBase(pydantic.BaseModel):
-    """Basis for all descriptor objects."""
+# `dataclasses.dataclass` only accepts `slots` from Python 3.10 on. On earlier
+# versions the descriptors are frozen dataclasses with an instance `__dict__`.
+_DATACLASS_SLOTS: tp.Dict[str, bool] = \
+    {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
+class DescriptorBase:
+    """Basis for all descriptor objects.
+
+    Descriptors are plain frozen (and slotted) dataclasses, and field values
+    are not validated or coerced on construction. Use `validate` to check and
+    coerce field values against the type annotations, e.g. for descriptors
+    that are about to be written or that come from an untrusted source.
+
+    Descriptors are frozen since instances returned by `dict_from_yaml` are
+    cached and shared. Use `dataclasses.replace` to get a modified copy.
+    """
     id: str
     """Id (short name). Should be a valid Python variable name."""
-    name: tp.Optional[str]
+    name: tp.Optional[str] = None
     """Full name. Optional (but highly recommended)"""
-    parent_id: tp.Optional[str]
+    parent_id: tp.Optional[str] = None
     """ID of parent dataset or dataset collection. Optional (and may not be
     applicable at all)."""
-    description: tp.Optional[str]
+    description: tp.Optional[str] = None
     """Free-form description. Optional"""
-    notes: tp.Optional[str]
+    notes: tp.Optional[str] = None
     """Notes, as a single string. Optional."""
 
+    _path_fields: tp.ClassVar[tp.Tuple[str, ...]] = ()
+    """Names of fields that hold a Path or a dict of Paths. Used by
+    `dict_from_yaml` to convert str values to Path, since descriptors are
+    constructed without type coercion."""
+
+    _tuple_fields: tp.ClassVar[tp.Tuple[str, ...]] = ()
+    """Names of fields that hold a tuple. Used by `dict_from_yaml` to convert
+    list values to tuples, like validation does."""
+
+    @classmethod
+    def from_dict(cls, data: tp.Mapping[str, tp.Any]) -> DescriptorBase:
+        """Create a descriptor from a dict of field values, without validation.
+
+        Keys that are not fields of `cls` are ignored, in the same way as when
+        validating with pydantic (`validate=True` in `dict_from_yaml`).
+
+        Parameters
+        ----------
+        data : Mapping
+            Field values, keyed by field name.
+
+        Returns
+        -------
+        DescriptorBase
+            A new instance of `cls`.
+        """
+        field_names: tp.FrozenSet[str] = _field_names(cls)
+        if data.keys() <= field_names:
+            return cls(**data)
+        return cls(**{
+            _key: _value for _key, _value in data.items()
+            if _key in field_names
+        })
+    ###END def DescriptorBase.from_dict
+
+    def validate(self) -> DescriptorBase:
+        """Validate field values against the type annotations.
+
+        Uses pydantic to validate and coerce the field values (e.g., str to
+        Path where a Path is expected).
+
+        Returns
+        -------
+        DescriptorBase
+            A new, validated instance of the same class as `self`.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If any of the field values are invalid.
+        """
+        _fields: tp.Dict[str, tp.Any] = {
+            _field.name: getattr(self, _field.name)
+            for _field in dataclasses.fields(self)
+        }
+        return _validate_python(type(self), _fields)
+    ###END def DescriptorBase.validate
+
     def with_base_path(
         self,
         basepath: tp.Union[Path, str],
@@ -44,26 +122,41 @@ class DescriptorBase(pydantic.BaseModel):
             Whether to force paths to be absolute (through `Path.absolute`)
             after the base path has been prefixed. Optional, by default True.
         inplace : bool, optional
-            Whether to add the base path in the object itself. If False, the
-            changes are made to a copy which is then returned. Optional, by
-            default False.
+            Not supported, since descriptors are frozen (and those returned by
+            `dict_from_yaml` are shared). Must be False, which is the default.
+            The changes are made to a copy which is then returned.
         
         Returns
         -------
         DescriptorBase
-            The object itself (if `inplace` is True) or a copy with the prefixed
-            base path."""
-        basepath = Path(basepath)
-        action: tp.Callable[[Path], Path]
-        if make_absolute:
-            action = lambda p: (basepath / p).absolute()
-        else:
-            action = lambda p: basepath / p
+            A copy with the prefixed base path.
+
+        Raises
+        ------
+        ValueError
+            If `inplace` is True.
+        """
+        if inplace:
+            raise ValueError(
+                '`inplace=True` is not supported, since descriptors are '
+                'frozen. Use the returned copy instead.'
+            )
+        basepath_str: str = os.fspath(basepath)
+        # Making the base path absolute once gives the same result as making
+        # each prefixed path absolute, since `Path.absolute` does not
+        # normalize the path (so `os.path.abspath`, which does, is not used).
+        if make_absolute and not os.path.isabs(basepath_str):
+            basepath_str = os.path.join(os.getcwd(), basepath_str)
+        # Absolute paths are returned as they are, since prefixing would not
+        # change them anyway.
+        def _prefix(path: Path) -> Path:
+            if path.is_absolute():
+                return path
+            return Path(os.path.join(basepath_str, os.fspath(path)))
         new_obj: DescriptorBase = helpers.recurse_by_type(
             self,
             match_type=Path,
-            action=action,
-            inplace=inplace
+            action=_prefix
         )
         return new_obj
     ###END def DescriptorBase.with_base_path
@@ -75,7 +168,10 @@ class DescriptorBase(pydantic.BaseModel):
         descriptors_key: str = 'datasets',
         parse_func: tp.Callable[[yamlfuncs._YamlDataType],
                                  yamlfuncs._YamlDataType] \
-            = yamlfuncs.resolve_variables
+            = yamlfuncs.resolve_variables,
+        validate: bool = False,
+        cache_dir: tp.Optional[tp.Union[Path, str, tp.Literal[False]]] \
+            = None
     ) -> tp.Dict[str, DescriptorBase]:
         """Load descriptors from a YAML file.
         
@@ -91,6 +187,15 @@ class DescriptorBase(pydantic.BaseModel):
             structure similar to what would be returned by
             `yamlfuncs.load_yaml`, and parse any dynamic variables used in the
             file. Optional, by default uses `yamlfuncs.resolve_variables`.
+        validate : bool, optional
+            Whether to validate each descriptor (with `validate`) after
+            construction. Use for yaml files that are not trusted. Optional,
+            by default False.
+        cache_dir : Path or str or False, optional
+            Directory for the on-disk cache of the parsed yaml file (see
+            `yamlfuncs.load_parsed_yaml`). If None, the default directory
+            from `yamlfuncs.default_cache_dir` is used. Pass False to not use
+            the on-disk cache. Optional, by default None.
 
         Returns
         -------
@@ -98,34 +203,109 @@ class DescriptorBase(pydantic.BaseModel):
             A dict of descriptor instances. The keys are the IDs, prefixed with
             parent IDs (if present) followed by underscore. If parent IDs are
             not present, the IDs alone are used as keys.
+
+        Notes
+        -----
+        The descriptors are constructed with `from_dict`, without validation,
+        since the yaml file is trusted and validating each record is expensive
+        for large files. Values are therefore stored as given, except that str
+        values in the fields listed in `_path_fields` are converted to Path
+        instances, and list values in the fields listed in `_tuple_fields` to
+        tuples. Pass `validate=True` if validation is needed.
+
+        The result is cached in memory on the absolute path, modification time and size
+        of `descriptors_file` (along with the other arguments), so the file is
+        only read again if it has changed. The returned dict is a new dict,
+        but the descriptor instances in it are shared between calls, and
+        should not be modified in place. The parsed yaml data is also cached
+        on disk in `cache_dir`, so that it can be reused across processes.
+        """
+        descriptors_file = os.path.abspath(descriptors_file)
+        file_stat: os.stat_result = os.stat(descriptors_file)
+        return dict(
+            _read_descriptors_cached(
+                cls,
+                descriptors_file,
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+                descriptors_key,
+                parse_func,
+                validate,
+                cache_dir
+            )
+        )
+    ###END def DescriptorBase.from_yaml
+
+    @classmethod
+    def _read_descriptors(
+        cls,
+        descriptors_file: str,
+        descriptors_key: str,
+        parse_func: tp.Callable[[yamlfuncs._YamlDataType],
+                                 yamlfuncs._YamlDataType],
+        validate: bool = False,
+        cache_dir: tp.Optional[tp.Union[Path, str, tp.Literal[False]]] = None
+    ) -> tp.Dict[str, DescriptorBase]:
+        """Reads descriptors from a YAML file, without caching.
+
+        Called by `dict_from_yaml` (through `_read_descriptors_cached`), see
+        that method for parameters and return value.
         """
-        _YamlDataType = yamlfuncs._YamlDataType
-        with open(descriptors_file, mode='r') as f:
-            data: _YamlDataType = yamlfuncs.load_yaml(f)
-        data = parse_func(data)
+        data: yamlfuncs._YamlDataType = yamlfuncs.load_parsed_yaml(
+            descriptors_file,
+            parse_func=parse_func,
+            cache_dir=cache_dir
+        )
+        records: tp.List[tp.Dict[str, tp.Any]] = data[descriptors_key]
+        descriptors: tp.List[DescriptorBase]
+        if validate:
+            # Validate all records in a single call, rather than one by one
+            descriptors = _validate_python(tp.List[cls], records)
+        else:
+            path_fields: tp.Tuple[str, ...] = cls._path_fields
+            tuple_fields: tp.Tuple[str, ...] = cls._tuple_fields
+            _record: tp.Dict[str, tp.Any]
+            for _record in records:
+                for _field in tuple_fields:
+                    _value = _record.get(_field)
+                    if isinstance(_value, list):
+                        _record[_field] = tuple(_value)
+                for _field in path_fields:
+                    _value = _record.get(_field)
+                    if isinstance(_value, str):
+                        _record[_field] = Path(_value)
+                    elif isinstance(_value, dict):
+                        _record[_field] = {
+                            _key: Path(_path) for _key, _path in _value.items()
+                        }
+            descriptors = [cls.from_dict(_record) for _record in records]
         datasets: tp.Dict[str, DescriptorBase] = dict()
-        _dataset: tp.Dict[str, tp.Any]
         _descr: DescriptorBase
-        for _dataset in data[descriptors_key]:
-            _descr = DescriptorBase(**_dataset)
+        # Keys are interned, since they will typically be looked up with
+        # string literals (which are interned), making the lookups cheaper.
+        for _descr in descriptors:
             if _descr.parent_id is not None:
-                _dataset_key: str = f'{_descr.parent_id}_{_descr.id}'
+                _dataset_key: str = '_'.join(
+                    (str(_descr.parent_id), str(_descr.id))
+                )
             else:
-                _dataset_key: str = f'{_descr.id}'
-            datasets[_dataset_key] = _descr
+                _dataset_key: str = str(_descr.id)
+            datasets[sys.intern(_dataset_key)] = _descr
         return datasets
-    ###END def DescriptorBase.from_yaml
+    ###END def DescriptorBase._read_descriptors
+
 
 ###END class DescriptorBase
 
 
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DatasetDescriptorBase(DescriptorBase):
     """Basis for dataset descriptor objects."""
-    raw_data_path: tp.Optional[tp.Union[Path, tp.Dict[str, Path]]]
+    raw_data_path: tp.Optional[tp.Union[Path, tp.Dict[str, Path]]] = None
     """Path to raw data file(s). Either a single Path instance, or a dict of
     Path instances. If a dict, the keys will be interpreted as version
     identifiers. Optional."""
-    default_version: tp.Optional[str]
+    default_version: tp.Optional[str] = None
     """Default version of the dataset, if there are multiple versions. If
     specified, it is assumed that `raw_data_path` (if it itself is specified)
     is a dict with version ids as keys."""
@@ -134,4 +314,64 @@ class DatasetDescriptorBase(DescriptorBase):
     Optional, by default set to an empty tuple (but can be explicitly set to 
     None if desired, to explicitly show if the concept of dimensions is not
     relevant to the given dataset)."""
+
+    _path_fields: tp.ClassVar[tp.Tuple[str, ...]] = ('raw_data_path',)
+    _tuple_fields: tp.ClassVar[tp.Tuple[str, ...]] = ('dimensions',)
 ###END class DatasetDescriptorBase
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(descriptor_class: type) -> tp.FrozenSet[str]:
+    """Returns the (cached) names of the fields of a dataclass type, which
+    can be set through its `__init__` method."""
+    return frozenset(
+        _field.name for _field in dataclasses.fields(descriptor_class)
+        if _field.init
+    )
+###END def _field_names
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(type_: tp.Any) -> pydantic.TypeAdapter:
+    """Returns a (cached) pydantic `TypeAdapter` for `type_`. Creating a
+    `TypeAdapter` builds a validation schema, which is expensive."""
+    return pydantic.TypeAdapter(type_)
+###END def _type_adapter
+
+
+def _validate_python(type_: tp.Any, obj: tp.Any) -> tp.Any:
+    """Validates `obj` as an instance of `type_` with pydantic.
+
+    Uses a cached `TypeAdapter` on pydantic v2, and `parse_obj_as` on v1.
+    """
+    if hasattr(pydantic, 'TypeAdapter'):
+        return _type_adapter(type_).validate_python(obj)
+    return pydantic.parse_obj_as(type_, obj)
+###END def _validate_python
+
+
+@functools.lru_cache(maxsize=32)
+def _read_descriptors_cached(
+    descriptor_class: tp.Type[DescriptorBase],
+    descriptors_file: str,
+    mtime_ns: int,
+    size: int,
+    descriptors_key: str,
+    parse_func: tp.Callable[[yamlfuncs._YamlDataType],
+                             yamlfuncs._YamlDataType],
+    validate: bool,
+    cache_dir: tp.Optional[tp.Union[Path, str, tp.Literal[False]]]
+) -> tp.Dict[str, DescriptorBase]:
+    """Cached wrapper around `DescriptorBase._read_descriptors`.
+
+    `mtime_ns` and `size` are not used, but are included so that they become
+    part of the cache key, and a changed file is read again.
+    """
+    return descriptor_class._read_descriptors(
+        descriptors_file,
+        descriptors_key=descriptors_key,
+        parse_func=parse_func,
+        validate=validate,
+        cache_dir=cache_dir
+    )
+###END def _read_descriptors_cached
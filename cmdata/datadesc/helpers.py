@@ -5,6 +5,8 @@ import typing as tp
 from pathlib import Path
 import re
 import copy
+import dataclasses
+import functools
 
 
 def recurse_by_type(
@@ -22,71 +24,240 @@ def recurse_by_type(
     
     Parameters
     ----------
-    obj : sequence or dict-like
-        The object to recurse through. Must be either a sequence that can be
-        iterated over, or a dict or similar data type with an `items` method
-        that provides an iterable that yields all the keys and values.
+    obj : list, tuple, dict or dataclass instance
+        The object to recurse through. Must be either a list or tuple, a dict
+        (or dict subclass), or a dataclass instance, in which case the fields
+        are recursed through. Nested elements are only descended into if they
+        are of one of these types (other sequence types, such as str, are
+        left as they are).
     match_type : type
         Type to match. Elements `x` for which `isinstance(x, match_type)`
         returns True will be acted on. NB! If `match_type` is itself a dict
         or sequence type, recursion will stop once it is matched. The
-        matching dict/sequence will not be descended into.
+        matching dict/sequence will not be descended into. Fields of
+        dataclass instances whose type annotations show that they cannot
+        hold `match_type` instances (e.g., `str` or `Optional[str]` fields)
+        are skipped without being inspected.
     action : callable
-        The action to apply to matching elements
+        The action to apply to matching elements. If it returns the element
+        itself (the identical object), the element is treated as unchanged.
     recurse_depth : int, optional
         Depth to recurse to. `1` means only act on the first-level elements of
         `obj` and do not recurse. None means no limit, recurse until only
-        a level is reached that contains no further sequences or dicts, or
-        until the stack size limit is reached and an exception is raised.
+        a level is reached that contains no further sequences or dicts.
         Optional, by default None.
     inplace : bool, optional
-        Whether to make changes inplace. Optional, by default False
+        Whether to make changes inplace. Optional, by default False. Note that
+        tuples and frozen dataclass instances (which are immutable) are always
+        replaced by new objects if any of their elements are changed.
 
     Returns
     -------
         `obj` (if `inplace` is True) or a copy (if `inplace` is False) with
-        the transformed values.
+        the transformed values. Only containers that (directly or further
+        down) contain matching elements are copied. Containers without any
+        matching elements are shared between `obj` and the returned copy.
     """
-    _obj: tp.Any = obj if inplace else copy.copy(obj)
-    if isinstance(_obj, match_type):
-        return action(_obj)
-    # Recurse if recurse_depth has not been reached, and if
-    # _obj is a dict or sequence (but not str)
-    if (recurse_depth is None or recurse_depth > 0) \
-            and (isinstance(_obj, tp.Dict) or
-                 isinstance(_obj, tp.Sequence)) \
-                and not isinstance(_obj, str):
-    # Get an iterable that will yield values and keys (if dict) or index values
-    # (if a sequence)
-        _iterobj = None
-        if isinstance(_obj, tp.Dict):
-            _iterobj = _obj.items()
-        if isinstance(_obj, tp.Sequence):
-            _iterobj = enumerate(_obj)
-        # If _iterobj is still None, _obj is not a dict or sequence, so return
-        if _iterobj is None:
-            return _obj
-        _key: tp.Union[str, int]
-        _val: tp.Any
-        for _key, _val in _iterobj:
-            _obj[_key] = recurse_by_type(
-                obj=_val,
-                match_type=match_type,
-                action=action,
-                recurse_depth=None if recurse_depth is None \
-                    else recurse_depth-1,
-                inplace=inplace
-            )
-    return _obj
+    # The recursion is done with an explicit stack rather than recursive
+    # calls. Each stack entry is a container whose elements are being
+    # processed, with the remaining recursion depth for its elements, an
+    # iterator over its (key, value) pairs, its key in its parent container,
+    # and a list of (key, new value) pairs for the elements that have been
+    # changed. A container is only updated (or copied, if `inplace` is False)
+    # once all its elements have been processed, and only if any of them have
+    # changed. `obj` itself is put inside a single-element list, so that it
+    # can be handled the same way as any other element.
+    root: tp.List[tp.Any] = [obj]
+    stack: tp.List[
+        tp.Tuple[
+            tp.Any,
+            tp.Optional[int],
+            tp.Iterator[tp.Tuple[tp.Any, tp.Any]],
+            tp.Any,
+            tp.List[tp.Tuple[tp.Any, tp.Any]]
+        ]
+    ] = [(root, recurse_depth, iter(enumerate(root)), None, [])]
+    _container: tp.Any
+    _child_depth: tp.Optional[int]
+    _items: tp.Iterator[tp.Tuple[tp.Any, tp.Any]]
+    _parent_key: tp.Any
+    _changes: tp.List[tp.Tuple[tp.Any, tp.Any]]
+    _key: tp.Any
+    _val: tp.Any
+    _new_val: tp.Any
+    _new_container: tp.Any
+    while stack:
+        _container, _child_depth, _items, _parent_key, _changes = stack[-1]
+        for _key, _val in _items:
+            if isinstance(_val, match_type):
+                _new_val = action(_val if inplace else copy.copy(_val))
+                if _new_val is not _val:
+                    _changes.append((_key, _new_val))
+            # Descend into dicts, lists, tuples and dataclass instances, unless
+            # the maximum depth has been reached. Everything else is left as it
+            # is. Concrete types are used rather than `tp.Dict`/`tp.Sequence`,
+            # since isinstance checks against ABCs are much slower.
+            elif (_child_depth is None or _child_depth > 0) \
+                    and (isinstance(_val, (dict, list, tuple))
+                         or _is_dataclass_instance(_val)):
+                stack.append(
+                    (
+                        _val,
+                        None if _child_depth is None else _child_depth - 1,
+                        _iter_items(_val, match_type),
+                        _key,
+                        []
+                    )
+                )
+                break
+        else:
+            # All elements of `_container` have been processed.
+            stack.pop()
+            if not stack:
+                return _changes[0][1] if _changes else obj
+            if _changes:
+                _new_container = _with_changes(_container, _changes, inplace)
+                if _new_container is not _container:
+                    stack[-1][4].append((_parent_key, _new_container))
 ###END def recurse_by_type
 
 
+def _iter_items(
+    container: tp.Any,
+    match_type: type
+) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
+    """Returns an iterator over (key, value) pairs of a dict, (field name,
+    value) pairs of a dataclass instance, or (index, value) pairs of a
+    sequence.
+
+    For dataclass instances, fields whose type annotations show that they
+    cannot hold any `match_type` instances are skipped (see
+    `_fields_for_type`)."""
+    if isinstance(container, dict):
+        return iter(container.items())
+    if _is_dataclass_instance(container):
+        return (
+            (_name, getattr(container, _name))
+            for _name in _fields_for_type(type(container), match_type)
+        )
+    return iter(enumerate(container))
+###END def _iter_items
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_for_type(
+    dataclass_type: type,
+    match_type: type
+) -> tp.Tuple[str, ...]:
+    """Returns the names of the fields of a dataclass that may hold instances
+    of `match_type`, either directly or nested in containers.
+
+    Determined from the type annotations of the fields, and cached per
+    dataclass and `match_type`. If the annotations cannot be resolved, all
+    fields are returned."""
+    _field_names: tp.Tuple[str, ...] = tuple(
+        _field.name for _field in dataclasses.fields(dataclass_type)
+    )
+    try:
+        _hints: tp.Dict[str, tp.Any] = tp.get_type_hints(dataclass_type)
+    except Exception:
+        return _field_names
+    return tuple(
+        _name for _name in _field_names
+        if _type_may_hold(_hints.get(_name, tp.Any), match_type)
+    )
+###END def _fields_for_type
+
+
+_SCALAR_TYPES: tp.Tuple[type, ...] = (
+    str, bytes, int, float, complex, bool, type(None)
+)
+"""Types that are known not to hold any other objects, used by
+`_type_may_hold`."""
+
+
+def _type_may_hold(annotation: tp.Any, match_type: type) -> bool:
+    """Returns False if values annotated with `annotation` can neither be nor
+    contain `match_type` instances, and True otherwise (also if unsure)."""
+    _origin: tp.Any = tp.get_origin(annotation)
+    if _origin is tp.Literal:
+        return False
+    if _origin is not None:
+        return any(
+            _type_may_hold(_arg, match_type)
+            for _arg in tp.get_args(annotation) if _arg is not Ellipsis
+        )
+    if isinstance(annotation, type):
+        return issubclass(annotation, match_type) \
+            or not issubclass(annotation, _SCALAR_TYPES)
+    return True
+###END def _type_may_hold
+
+
+def _with_changes(
+    container: tp.Any,
+    changes: tp.List[tp.Tuple[tp.Any, tp.Any]],
+    inplace: bool
+) -> tp.Any:
+    """Sets new values for the given (key, value) pairs in a dict, dataclass
+    instance or sequence, and returns the changed container.
+
+    The changes are made in a shallow copy of `container` unless `inplace` is
+    True. Tuples are always replaced by new tuples, and frozen dataclass
+    instances by changed copies, since they are immutable. Fields of the
+    copies are set with `object.__setattr__` (the same way as in the
+    `__init__` generated for frozen dataclasses)."""
+    _key: tp.Any
+    _val: tp.Any
+    if isinstance(container, tuple):
+        _list: tp.List[tp.Any] = list(container)
+        for _key, _val in changes:
+            _list[_key] = _val
+        return tuple(_list)
+    if not inplace or _is_frozen_dataclass_instance(container):
+        # Plain dicts and lists are copied directly, which is much faster
+        # than the generic dispatch in `copy.copy`.
+        _type: type = type(container)
+        if _type is dict:
+            container = container.copy()
+        elif _type is list:
+            container = container[:]
+        else:
+            container = copy.copy(container)
+    if _is_dataclass_instance(container):
+        for _key, _val in changes:
+            object.__setattr__(container, _key, _val)
+    else:
+        for _key, _val in changes:
+            container[_key] = _val
+    return container
+###END def _with_changes
+
+
+def _is_dataclass_instance(obj: tp.Any) -> bool:
+    """Returns True if `obj` is a dataclass instance (not a dataclass type)."""
+    return dataclasses.is_dataclass(obj) and not isinstance(obj, type)
+###END def _is_dataclass_instance
+
+
+def _is_frozen_dataclass_instance(obj: tp.Any) -> bool:
+    """Returns True if `obj` is an instance of a frozen dataclass."""
+    return _is_dataclass_instance(obj) \
+        and type(obj).__dataclass_params__.frozen
+###END def _is_frozen_dataclass_instance
+
+
 _IndexedData = tp.Union[str, tp.Dict[str, tp.Any], tp.List[tp.Any]]
 
+_DEFAULT_VAR_PATTERN: re.Pattern = re.compile(r'\$\{([^}]+)\}')
+"""Default variable pattern for `substitute_var`. Matches `${...}`, where the
+contents cannot contain `}`. Using a negated character class rather than `.+`
+keeps matching linear, and allows several variables in the same string."""
+
 def substitute_var(
     text: str,
     substitute_data: _IndexedData,
-    var_pattern: re.Pattern = re.compile(r'\$\{(.+)\}'),
+    var_pattern: tp.Optional[re.Pattern] = None,
     separator: str = '/'
 ) -> str:
     """Substitute variables from a provided data structure in a string.
@@ -104,7 +275,7 @@ def substitute_var(
     `substitute_data` is a nested data structure, and the pattern will be
     replaced by `subtitute_data[index0][index1]`. More indexes can be added,
     each separated by a slash, for deeper nesting. Each index can contain any
-    character other than the separator character (by default `'/'`). 
+    character other than the separator character (by default `'/'`) and `}`.
 
     If needed, the pattern to be substituted can be changed from `${...}`
     through the optional parameter `var_pattern`, and the separator character
@@ -123,20 +294,78 @@ def substitute_var(
         The entire pattern is substituted, and must contain a single matching
         group which will be used as index or indices to retrieve values from
         `substitute_data`. Must be a compiled `re.Pattern` instance, not a
-        `str`. Optional, by default `re.compile(r'\$\{(.+)+\}')`.
+        `str`. Optional, by default `_DEFAULT_VAR_PATTERN`, i.e.
+        `re.compile(r'\$\{([^}]+)\}')`.
     separator : str, optional
         Character or string to use as separator. Will be used to split the
         string returned in the matching group in `var_pattern`. None of the
         indexes can contain this character at all. There currently no mechanism
         for escaping the separator character if it occurs in any index values. 
         Optional, by default `'/'`.
+
+    Notes
+    -----
+    Each distinct `text` is only scanned with `var_pattern` once (see
+    `_parse_template`). Later calls only do the lookups in `substitute_data`
+    and join the parts, without calling back from the regex engine per match.
+    `str.format_map` or `string.Template` are not used, since they would
+    require rewriting the templates (and escaping literal braces), and would
+    not support arbitrary patterns through `var_pattern`.
     """
-    def get_subst(match: re.Match) -> str:
-        indexes: tp.List[str] = match.group(1).split(separator)
-        _subs = substitute_data
-        for index in indexes:
-            _subs = _subs[index]
-        return _subs
-    ###END def substitute_var.get_subst
-    return var_pattern.sub(get_subst, text)
+    if var_pattern is None:
+        # Most strings contain no variables, and a substring test is much
+        # cheaper than running the regex.
+        if '${' not in text:
+            return text
+        var_pattern = _DEFAULT_VAR_PATTERN
+    segments: _TemplateSegments = _parse_template(text, var_pattern, separator)
+    if len(segments) == 1 and segments[0][1] is None:
+        return text
+    parts: tp.List[str] = []
+    _literal: str
+    _indexes: tp.Optional[tp.Tuple[str, ...]]
+    for _literal, _indexes in segments:
+        parts.append(_literal)
+        if _indexes is not None:
+            _subs = substitute_data
+            for _index in _indexes:
+                _subs = _subs[_index]
+            parts.append(_subs)
+    return ''.join(parts)
 ###END def sbustitute_var
+
+
+_TemplateSegments = tp.Tuple[
+    tp.Tuple[str, tp.Optional[tp.Tuple[str, ...]]], ...
+]
+"""Type for a parsed template string, see `_parse_template`."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(
+    text: str,
+    var_pattern: re.Pattern,
+    separator: str
+) -> _TemplateSegments:
+    """Splits a string into segments of literal text and variables.
+
+    Returns a tuple of `(literal, indexes)` pairs, where `literal` is the text
+    preceding a variable, and `indexes` is a tuple of the indexes in the
+    variable (split by `separator`). The last pair holds any text after the
+    last variable, with `indexes` set to None. Cached, so that template
+    strings that are used repeatedly are only scanned by `var_pattern` once.
+    """
+    segments: tp.List[tp.Tuple[str, tp.Optional[tp.Tuple[str, ...]]]] = []
+    _pos: int = 0
+    _match: re.Match
+    for _match in var_pattern.finditer(text):
+        segments.append(
+            (
+                text[_pos:_match.start()],
+                tuple(_match.group(1).split(separator))
+            )
+        )
+        _pos = _match.end()
+    segments.append((text[_pos:], None))
+    return tuple(segments)
+###END def _parse_template
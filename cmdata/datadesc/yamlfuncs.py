@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 import typing as tp
-import copy
+from pathlib import Path
+import os
+import hashlib
+import inspect
+import functools
+import pickle
+import tempfile
 
-import ruamel.yaml as yaml
+from cmhelpers import yaml_utils
 
 from . import helpers
 
@@ -12,18 +18,160 @@ from . import helpers
 _YamlDataType = tp.Union[str, tp.Dict[str, tp.Any], tp.List[tp.Any]]
 """Data type for output from yaml-file parsing."""
 
+
+def default_cache_dir() -> Path:
+    """Returns the default directory for the on-disk cache used by
+    `load_parsed_yaml`.
+
+    The directory is `cmdata` under `$XDG_CACHE_HOME`, or under `~/.cache` if
+    that is not set. It is determined each time the function is called, so
+    that changes to the environment are respected.
+    """
+    return Path(
+        os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    ) / 'cmdata'
+###END def default_cache_dir
+
+
 def load_yaml(yamlfile: Path, **kwargs) -> _YamlDataType:
-    """Load yaml files. Currently just wraps ruamel.yaml.safe_load"""
-    return yaml.safe_load(yamlfile, **kwargs)
+    """Load yaml files with the ruamel.yaml safe loader.
+
+    Uses `cmhelpers.yaml_utils.safe_load`, i.e. the C-based loader when
+    available. Keyword arguments are passed on to that function.
+    """
+    return yaml_utils.safe_load(yamlfile, **kwargs)
 ###END def load_yaml
 
 class VarResolutionError(Exception):
-    """Raised if `resolve_variables` does not return before reaching max 
-    number of iterations."""
+    """Raised if `resolve_variables` finds circular variable definitions, or
+    variable references nested deeper than the maximum allowed depth."""
     pass
 ###END class VarResolutionError
 
 
+_PathType = tp.Tuple[tp.Hashable, ...]
+"""Type for the location of a value in a nested data structure, given as the
+sequence of keys/indexes used to reach it from the top level."""
+
+
+class _VarResolver:
+    """Resolves variables in the strings of a nested data structure.
+
+    Each string is resolved at most once, the first time it is needed. The
+    result only depends on the string itself (the data it is resolved against
+    is fixed for the resolver), so results are memoized by string value, and
+    strings that occur in several places (e.g., shared path templates) are
+    only substituted once. Strings that are referenced by other strings are
+    resolved recursively before substitution (i.e., in topological order), so
+    a single pass over the data suffices.
+
+    `subst_func` is not passed the raw data, but a read-only view of it (see
+    `_ResolvingMapping` and `_ResolvingSequence`), in which strings are
+    resolved as they are looked up.
+    """
+
+    def __init__(
+        self,
+        data: _YamlDataType,
+        subst_func: tp.Callable[[str, _YamlDataType], str],
+        max_depth: int
+    ):
+        self.subst_func: tp.Callable[[str, _YamlDataType], str] = subst_func
+        self.max_depth: int = max_depth
+        self.resolved: tp.Dict[str, str] = dict()
+        # Strings currently being resolved, with their locations (if known),
+        # used to detect circular definitions. A string that depends on an
+        # identical string elsewhere necessarily depends on itself, so keying
+        # on the string rather than the location loses nothing.
+        self.in_progress: tp.Dict[str, tp.Optional[_PathType]] = dict()
+        self.view: tp.Any = self.wrap(data, ())
+    ###END def _VarResolver.__init__
+
+    def wrap(self, value: tp.Any, path: _PathType) -> tp.Any:
+        """Resolves `value` if it is a str, or returns a resolving view of it
+        if it is a dict or list. Other values are returned as they are."""
+        if isinstance(value, str):
+            return self.resolve(value, path)
+        if isinstance(value, dict):
+            return _ResolvingMapping(self, value, path)
+        if isinstance(value, list):
+            return _ResolvingSequence(self, value, path)
+        return value
+    ###END def _VarResolver.wrap
+
+    def resolve(self, text: str, path: tp.Optional[_PathType] = None) -> str:
+        """Returns `text` with variables substituted. `path` is the location
+        of `text` in the data if known, only used for error messages."""
+        try:
+            return self.resolved[text]
+        except KeyError:
+            pass
+        if text in self.in_progress:
+            _cycle: str = ' -> '.join(
+                repr(_text) if _path is None
+                    else '/'.join(str(_index) for _index in _path)
+                for _text, _path in (*self.in_progress.items(), (text, path))
+            )
+            raise VarResolutionError(
+                f'Circular variable definitions: {_cycle}'
+            )
+        if len(self.in_progress) >= self.max_depth:
+            raise VarResolutionError(
+                f'Maximum depth of nested variable references '
+                f'({str(self.max_depth)}) exceeded! Set `max_iterations` to a '
+                'higher value if the variable definitions are deeply nested.'
+            )
+        self.in_progress[text] = path
+        try:
+            result: str = self.subst_func(text, self.view)
+        finally:
+            del self.in_progress[text]
+        self.resolved[text] = result
+        return result
+    ###END def _VarResolver.resolve
+
+###END class _VarResolver
+
+
+class _ResolvingMapping(tp.Mapping):
+    """Read-only view of a dict, which resolves variables in str values when
+    they are looked up. Nested dicts and lists are returned as views."""
+    __slots__ = ('_resolver', '_data', '_path')
+
+    def __init__(self, resolver: _VarResolver, data: dict, path: _PathType):
+        self._resolver: _VarResolver = resolver
+        self._data: dict = data
+        self._path: _PathType = path
+
+    def __getitem__(self, key: tp.Hashable) -> tp.Any:
+        return self._resolver.wrap(self._data[key], self._path + (key,))
+
+    def __iter__(self) -> tp.Iterator[tp.Hashable]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+###END class _ResolvingMapping
+
+
+class _ResolvingSequence(tp.Sequence):
+    """Read-only view of a list, which resolves variables in str elements when
+    they are looked up. Nested dicts and lists are returned as views."""
+    __slots__ = ('_resolver', '_data', '_path')
+
+    def __init__(self, resolver: _VarResolver, data: list, path: _PathType):
+        self._resolver: _VarResolver = resolver
+        self._data: list = data
+        self._path: _PathType = path
+
+    def __getitem__(self, index: int) -> tp.Any:
+        return self._resolver.wrap(self._data[index], self._path + (index,))
+
+    def __len__(self) -> int:
+        return len(self._data)
+###END class _ResolvingSequence
+
+
 def resolve_variables(
     data: _YamlDataType,
     subst_func: tp.Callable[[str, _YamlDataType], str] = None,
@@ -31,6 +179,10 @@ def resolve_variables(
     inplace: bool = False
 ) -> _YamlDataType:
     """Substitutes variables in strings in a YAML data structure.
+
+    Every string is resolved exactly once. When a string references another
+    string that itself contains variables, the referenced string is resolved
+    first (recursively), so the data is only traversed once.
     
     Parameters
     ----------
@@ -38,66 +190,154 @@ def resolve_variables(
         The data to subsitute variables in.
     subst_func : callable
         Function to use for making substitutions in each string. Must take a
-        string and `data` as positional arguments and return a `str`. Optional,
-        by default uses `substitute_var` with default parameers.
+        string and `data` as positional arguments and return a `str`. Note
+        that `data` is passed as a read-only `Mapping` or `Sequence` view, in
+        which variables in strings are resolved when they are looked up.
+        Optional, by default uses `substitute_var` with default parameers.
     max_iterations : int, optional
-        Maximum number of times to iterate to resolve variables that reference
-        other variables. If the maximum number of iterations is exceeded without
-        having resolved all variables (which will happen if variables are
-        circularly defined, or nested too deep), a `VarResolutionError` is
-        raised.
+        Maximum depth of variables referencing other variables. If exceeded
+        (which may happen if variable definitions are nested too deep), a
+        `VarResolutionError` is raised. Circular variable definitions are
+        detected directly, and also raise a `VarResolutionError`. Optional, by
+        default 20.
     inplace : bool, optional
-        Whether or not to make substitutions inplace in `data`. If False, a deep
-        copy is made of `data` before subtitution starts. Note that if `data`
-        contains any memory-intensive data structures, this may consume a large
-        amount of resources, in which case `inplace` should be set to True for
-        better performance. Note that if `data` is a plain `str` instance, a
-        this parameter will be ignored (Python `str` instances are immutable).
-        This should be an edge case, since it is not very useful. Optional, by
-        default False.
+        Whether or not to make substitutions inplace in `data`. If False, only
+        the containers (dicts and lists) that contain strings with
+        substitutions (directly or further down) are copied, see Returns. Note
+        that if `data` is a plain `str` instance, this parameter will be
+        ignored (Python `str` instances are immutable). This should be an edge
+        case, since it is not very useful. Optional, by default False.
 
     Returns
     -------
     _YamlDataType
-        `data` itself or a copy thereof, with variables substituted.
+        `data` itself or a copy thereof, with variables substituted. If
+        `inplace` is False, containers without any substitutions are not
+        copied, but shared between `data` and the returned copy. Mutating
+        those in one of them will therefore also affect the other.
     """
     if subst_func is None:
         subst_func = helpers.substitute_var
-    if not inplace:
-        data = copy.deepcopy(data)
-    _num_iterations: int = 0
-    # Define a function to crawl through the data if it is not a pure str.
-    # It should return True if any substitutions were made.
-    def crawl_through_data(curr_data: _YamlDataType, 
-                           orig_data: _YamlDataType) -> bool:
-        made_substitutions: bool = False
-        indexes: list
-        if hasattr(curr_data, 'keys'):
-            indexes = curr_data.keys()
-        else:
-            indexes = range(0, len(curr_data))
-        for _i in indexes:
-            if isinstance(curr_data[_i], str):
-                new_str = subst_func(curr_data[_i], orig_data)
-                if new_str != curr_data[_i]:
-                    made_substitutions = True
-                curr_data[_i] = new_str
-            else:
-                made_substitutions = \
-                    crawl_through_data(curr_data[_i], orig_data)
-        return made_substitutions
-    ###END def resolve_variable.crawl_through_data
-    # Do the crawling, or just substitute if data is a plain string
+    # Just substitute if data is a plain string
     if isinstance(data, str):
         return subst_func(data, data)
-    while crawl_through_data(data, data):
-        _num_iterations += 1
-        if _num_iterations > max_iterations:
-            raise VarResolutionError(
-                f'Maximum number of iterations ({str(max_iterations)}) '
-                'exceeded! This may indicate circular variable definitions. '
-                'Set `max_iterations` to a higher value if the variable '
-                'definitions are deeply nested and you need more iterations.'
-            )
-    return data
+    resolver: _VarResolver = _VarResolver(
+        data,
+        subst_func=subst_func,
+        max_depth=max_iterations
+    )
+    # `recurse_by_type` only replaces (or copies, if not `inplace`) containers
+    # where a string has actually been changed by `resolver.resolve`.
+    return helpers.recurse_by_type(
+        data,
+        match_type=str,
+        action=resolver.resolve,
+        inplace=inplace
+    )
 ###END def resolve_variables
+
+
+def load_parsed_yaml(
+    yamlfile: tp.Union[Path, str],
+    parse_func: tp.Callable[[_YamlDataType], _YamlDataType] \
+        = resolve_variables,
+    cache_dir: tp.Optional[tp.Union[Path, str, tp.Literal[False]]] = None
+) -> _YamlDataType:
+    """Load a yaml file and parse it, with an on-disk cache of the result.
+
+    The parsed data is pickled to a file in `cache_dir`, together with the
+    modification time and size of `yamlfile`. On later calls (also in other
+    processes), the pickled data is used as long as the modification time and
+    size are unchanged, so that neither the yaml parsing nor `parse_func` have
+    to be run again. The cache file name also depends on the source code of
+    `parse_func` and of the modules used to load and parse the file, so that
+    cached data from earlier versions of the code is not used.
+
+    Parameters
+    ----------
+    yamlfile : Path or str
+        The yaml file to load.
+    parse_func : callable, optional
+        Function to parse the loaded data, e.g. to resolve variables. Must
+        be a module-level function, since it is identified by its module,
+        qualified name and source code in the cache. For other callables
+        (e.g. lambdas, local functions, `functools.partial` objects, callable
+        instances or functions without available source code), the cache is
+        not used. Optional, by default `resolve_variables`.
+    cache_dir : Path or str or False, optional
+        Directory to store the cache files in. If None, the directory returned
+        by `default_cache_dir` (at the time of the call) is used. Pass False
+        to not use the cache. Optional, by default None.
+
+    Returns
+    -------
+    _YamlDataType
+        The parsed data. A new object is returned on each call.
+    """
+    yamlfile = os.path.abspath(yamlfile)
+    # Callables without a qualified name (e.g. `functools.partial` objects or
+    # callable instances) and lambdas or local functions (whose names contain
+    # '<') cannot be told apart by name, and are never cached.
+    func_qualname: tp.Optional[str] = getattr(parse_func, '__qualname__', None)
+    code_version: tp.Optional[str] = None \
+        if cache_dir is False or func_qualname is None \
+        or '<' in func_qualname \
+        else _code_version(parse_func)
+    if code_version is None:
+        with open(yamlfile, mode='rb') as f:
+            return parse_func(load_yaml(f))
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    func_name: str = \
+        f'{getattr(parse_func, "__module__", None)}.{func_qualname}'
+    file_stat: os.stat_result = os.stat(yamlfile)
+    file_id: tp.Tuple[int, int] = (file_stat.st_mtime_ns, file_stat.st_size)
+    cache_file: Path = Path(cache_dir) / (
+        hashlib.sha256(
+            f'{yamlfile}\0{func_name}\0{code_version}'.encode()
+        ).hexdigest()
+        + '.pkl'
+    )
+    try:
+        with open(cache_file, mode='rb') as f:
+            cached_id, cached_data = pickle.load(f)
+        if cached_id == file_id:
+            return cached_data
+    except Exception:
+        # Missing, unreadable or corrupt cache files are treated as misses
+        pass
+    with open(yamlfile, mode='rb') as f:
+        data: _YamlDataType = parse_func(load_yaml(f))
+    # Write to a temporary file first, so that concurrent readers never see a
+    # partially written cache file.
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='wb', dir=cache_dir, suffix='.tmp', delete=False
+        ) as f:
+            pickle.dump((file_id, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_file)
+    except OSError:
+        pass
+    return data
+###END def load_parsed_yaml
+
+
+@functools.lru_cache(maxsize=32)
+def _code_version(parse_func: tp.Callable) -> tp.Optional[str]:
+    """Returns a digest of the source code of `parse_func` and of the modules
+    used by `load_parsed_yaml` to load and parse yaml files, to include in
+    cache keys. Returns None if the source code is not available."""
+    _digest: hashlib.blake2b = hashlib.blake2b(digest_size=16)
+    try:
+        _digest.update(inspect.getsource(parse_func).encode())
+        for _module_file in (
+                inspect.getfile(yaml_utils),
+                inspect.getfile(helpers),
+                __file__
+        ):
+            _digest.update(Path(_module_file).read_bytes())
+    except (OSError, TypeError):
+        return None
+    return _digest.hexdigest()
+###END def _code_version
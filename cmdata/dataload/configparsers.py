@@ -16,8 +16,28 @@ PathConfigParser(ConfigParserListMixin)
 from __future__ import annotations
 
 import typing as tp
+import os
+import sys
 from pathlib import Path
 import configparser
+import functools
+import types
+
+
+def _check_str(value: tp.Any, name: str) -> None:
+    """Raises TypeError if `value` is not a str. `name` is the name of the
+    attribute or parameter, used in the error message."""
+    if not isinstance(value, str):
+        raise TypeError(f'`{name}` must be a string instance.')
+###END def _check_str
+
+
+def _check_bool(value: tp.Any, name: str) -> None:
+    """Raises TypeError if `value` is not a bool. `name` is the name of the
+    attribute or parameter, used in the error message."""
+    if not isinstance(value, bool):
+        raise TypeError(f'`{name}` must be a bool instance.')
+###END def _check_bool
 
 
 class ConfigParserListMixin(configparser.ConfigParser):
@@ -40,16 +60,21 @@ class ConfigParserListMixin(configparser.ConfigParser):
     Properties
     ----------
     list_separator : str
-        Character(s) used as list separators. If not set explicitly or through
-        the `__init__` method, it will be set to `DEFAULT_LIST_SEPARATOR` the
-        first time it is accessed, either directly or through the `getlist`
-        method.
+        Character(s) used as list separators. `DEFAULT_LIST_SEPARATOR` unless
+        specified in the `__init__` method or set explicitly.
+    strip_items : bool
+        Whether `getlist` strips whitespace from lists and list items by
+        default. `_DEFAULT_STRIP_ITEMS` (True) unless specified in the
+        `__init__` method or set explicitly.
     """
 
     DEFAULT_LIST_SEPARATOR: str = '\n'
 
     _DEFAULT_STRIP_ITEMS: bool = True
 
+    _list_separator: str = DEFAULT_LIST_SEPARATOR
+    _strip_items: bool = _DEFAULT_STRIP_ITEMS
+
     def __init__(
         self,
         list_separator: str = None,
@@ -71,47 +96,90 @@ class ConfigParserListMixin(configparser.ConfigParser):
         **kwargs
             Additional keyword arguments to pass to the superclass `__init__`.
         """
+        # Cache of lists parsed by `getlist`. Must be set before calling the
+        # superclass `__init__`, which may call `set` to set defaults.
+        self._list_cache: tp.Dict[tp.Tuple, tp.List[tp.Any]] = {}
+        # Incremented whenever the caches are cleared, so that `getlistiter`
+        # can tell whether the configuration changed while it was iterating.
+        self._cache_generation: int = 0
         super().__init__(**kwargs)
+        # The class attributes `_list_separator` and `_strip_items` hold the
+        # defaults, so only set instance attributes for non-default values
+        # (including defaults that have been overridden in a subclass).
+        if list_separator is None \
+                and self.DEFAULT_LIST_SEPARATOR != self._list_separator:
+            list_separator = self.DEFAULT_LIST_SEPARATOR
         if list_separator is not None:
             self.list_separator = list_separator
+        if strip_items is None \
+                and self._DEFAULT_STRIP_ITEMS != self._strip_items:
+            strip_items = self._DEFAULT_STRIP_ITEMS
         if strip_items is not None:
             self.strip_items = strip_items
     ###END def ConfigParserListMixin.__init__
 
+    def _clear_caches(self) -> None:
+        """Clears cached values. Called whenever the configuration changes."""
+        self._list_cache.clear()
+        self._cache_generation += 1
+    ###END def ConfigParserListMixin._clear_caches
+
+    def set(self, section: str, option: str, value: tp.Optional[str] = None):
+        self._clear_caches()
+        super().set(section, option, value)
+    ###END def ConfigParserListMixin.set
+
+    def remove_option(self, section: str, option: str) -> bool:
+        self._clear_caches()
+        return super().remove_option(section, option)
+    ###END def ConfigParserListMixin.remove_option
+
+    def remove_section(self, section: str) -> bool:
+        self._clear_caches()
+        return super().remove_section(section)
+    ###END def ConfigParserListMixin.remove_section
+
+    def read(self, filenames, encoding: tp.Optional[str] = None) \
+            -> tp.List[str]:
+        self._clear_caches()
+        return super().read(filenames, encoding=encoding)
+    ###END def ConfigParserListMixin.read
+
+    def read_file(self, f: tp.Iterable[str], source: tp.Optional[str] = None):
+        self._clear_caches()
+        super().read_file(f, source=source)
+    ###END def ConfigParserListMixin.read_file
+
+    def __setitem__(self, key: str, value: tp.Any):
+        self._clear_caches()
+        super().__setitem__(key, value)
+    ###END def ConfigParserListMixin.__setitem__
+
+    def __delitem__(self, key: str):
+        self._clear_caches()
+        super().__delitem__(key)
+    ###END def ConfigParserListMixin.__delitem__
+
     @property
     def list_separator(self) -> str:
-        try:
-            return self.__list_separator
-        except NameError:
-            self.__list_separator: str = self.DEFAULT_LIST_SEPARATOR
-        return self.__list_separator
+        return self._list_separator
     ###END def property ConfgParserListMixin.list_separator
 
     @list_separator.setter
     def list_separator(self, listsep: str):
-        if not isinstance(listsep, str):
-            raise TypeError(
-                '`list_separator` must be a string instance.'
-            )
-        self.__list_separator: str = listsep
+        _check_str(listsep, 'list_separator')
+        self._list_separator: str = listsep
     ###END def list_separator.setter ConfigParserListMixin.list_separator
 
     @property
     def strip_items(self) -> bool:
-        try:
-            return self.__strip_items
-        except NameError:
-            self.__strip_items: bool = self._DEFAULT_STRIP_ITEMS
-        return self.__strip_items
+        return self._strip_items
     ###END def property ConfgParserListMixin.strip_items
 
     @strip_items.setter
     def strip_items(self, strip_items: bool):
-        if not isinstance(strip_items, bool):
-            raise TypeError(
-                '`strip_items` must be a bool instance.'
-            )
-        self.__strip_items: bool = strip_items
+        _check_bool(strip_items, 'strip_items')
+        self._strip_items: bool = strip_items
     ###END def strip_items.setter ConfigParserListMixin.strip_items
 
     def getlist(
@@ -121,6 +189,7 @@ class ConfigParserListMixin(configparser.ConfigParser):
         list_separator: str = None,
         strip_items: bool = None,
         item_type: type = str,
+        dedupe: bool = False,
         **kwargs
     ) -> tp.List[tp.Any]:
         """Returns a list-valued option as a list.
@@ -133,45 +202,276 @@ class ConfigParserListMixin(configparser.ConfigParser):
             As in standard `ConfigParser.get` method
         list_separator : str, optional
             List separator to use. Will be passed to `str.split` to split the
-            option value. Optional, `self.list_separator` by defaults.
+            option value (except for `'\n'` with `strip_items` True, in which
+            case `str.splitlines` is used). Optional, `self.list_separator` by
+            default.
         strip_items : bool, optional
-            Whether to strip whitespace from the list as a whole and to each
-            item after splitting (using `str.strip`). Optional,
-            `self.strip_items` by default.
+            Whether to strip whitespace from each item after splitting (using
+            `str.strip`), and drop items that are empty after stripping.
+            Optional, `self.strip_items` by default.
         item_type : type, optional
             What type to return the items as. Note that the type conversion
             will be made by feeding each item_value to `item_type` as a
             function. This must be supported by the `item_type` `__init__`
             method (i.e., the `__init__` method must take a single str value
             as an argument and convert it to the appropriate type). Optional,
-            `str` by default.
+            `str` by default. If `str`, the items are interned with
+            `sys.intern`.
+        dedupe : bool, optional
+            Whether to remove duplicate items, keeping the first occurrence of
+            each. Duplicates are identified before the conversion to
+            `item_type`. Optional, False by default.
         **kwargs
             Additional keyword arguments to pass to `ConfigParser.get`.
 
         Returns
         -------
         list
-            List with items of the type specified by `item_type`.
+            List with items of the type specified by `item_type`. Parsed lists
+            are cached until the configuration is changed, and a new copy of
+            the cached list is returned on each call.
+        """
+        if list_separator is None:
+            list_separator = self._list_separator
+        if strip_items is None:
+            strip_items = self._strip_items
+        _cache_key: tp.Optional[tp.Tuple] = self._list_cache_key(
+            section,
+            option,
+            list_separator,
+            strip_items,
+            item_type,
+            dedupe,
+            kwargs
+        )
+        if _cache_key is not None and _cache_key in self._list_cache:
+            return list(self._list_cache[_cache_key])
+        _valuelist: tp.List[tp.Any] = self._parse_list(
+            section=section,
+            option=option,
+            list_separator=list_separator,
+            strip_items=strip_items,
+            item_type=item_type,
+            dedupe=dedupe,
+            **kwargs
+        )
+        if _cache_key is not None:
+            self._list_cache[_cache_key] = _valuelist
+            return list(_valuelist)
+        return _valuelist
+    ###END def ConfigParserListMixin.getlist
+
+    def getlists(
+        self,
+        section: str,
+        options: tp.Iterable[str],
+        list_separator: str = None,
+        strip_items: bool = None,
+        item_type: type = str,
+        dedupe: bool = False,
+        **kwargs
+    ) -> tp.Dict[str, tp.List[tp.Any]]:
+        """Returns several list-valued options from a section.
+
+        Equivalent to calling `getlist` for each option, but resolves the
+        default list separator and stripping once for all options.
+
+        Parameters
+        ----------
+        section : str
+            As in standard `ConfigParser.get` method
+        options : iterable of str
+            The options to get
+        list_separator, strip_items, item_type, dedupe, **kwargs
+            See `getlist`.
+
+        Returns
+        -------
+        dict
+            Dict from each option name in `options` to its value as a list.
+        """
+        if list_separator is None:
+            list_separator = self._list_separator
+        if strip_items is None:
+            strip_items = self._strip_items
+        return {
+            _option: self.getlist(
+                section,
+                _option,
+                list_separator=list_separator,
+                strip_items=strip_items,
+                item_type=item_type,
+                dedupe=dedupe,
+                **kwargs
+            )
+            for _option in options
+        }
+    ###END def ConfigParserListMixin.getlists
+
+    def getlistiter(
+        self,
+        section: str,
+        option: str,
+        list_separator: str = None,
+        strip_items: bool = None,
+        item_type: type = str,
+        **kwargs
+    ) -> tp.Iterator[tp.Any]:
+        """Returns an iterator over the items of a list-valued option.
+
+        Works like `getlist`, but splits and converts the items lazily, so
+        that loops that stop early do not need to parse the whole list. If the
+        iterator is exhausted, the parsed list is added to the same cache as
+        used by `getlist` (unless the configuration was changed during the
+        iteration), and later calls iterate over the cached list.
+
+        Parameters
+        ----------
+        section, option, list_separator, strip_items, item_type, **kwargs
+            See `getlist`.
+
+        Returns
+        -------
+        iterator
+            Iterator over items of the type specified by `item_type`.
         """
         if list_separator is None:
-            list_separator = self.list_separator
+            list_separator = self._list_separator
         if strip_items is None:
-            strip_items = self.strip_items
+            strip_items = self._strip_items
+        _cache_key: tp.Optional[tp.Tuple] = self._list_cache_key(
+            section,
+            option,
+            list_separator,
+            strip_items,
+            item_type,
+            False,
+            kwargs
+        )
+        if _cache_key is not None and _cache_key in self._list_cache:
+            yield from self._list_cache[_cache_key]
+            return
+        _generation: int = self._cache_generation
+        _value: str = self._get_list_value(section, option, **kwargs)
+        _items: tp.List[tp.Any] = []
+        for _part in self._split_list_value(
+                _value,
+                list_separator,
+                strip_items
+        ):
+            if strip_items:
+                _part = _part.strip()
+                if not _part:
+                    continue
+            _item: tp.Any = sys.intern(_part) if item_type is str \
+                else item_type(_part)
+            _items.append(_item)
+            yield _item
+        # Do not cache the list if the configuration has changed since the
+        # value was read.
+        if _cache_key is not None and _generation == self._cache_generation:
+            self._list_cache[_cache_key] = _items
+    ###END def ConfigParserListMixin.getlistiter
+
+    def _get_list_value(self, section: str, option: str, **kwargs) -> str:
+        """Gets the raw string value of a list-valued option.
+
+        Unless `raw` or `vars` is given in `kwargs`, the value is first read
+        without interpolation, and is only read again with interpolation if
+        it contains a `'%'` or `'$'` character (i.e., if it could contain
+        interpolation syntax). This skips the interpolation machinery for
+        the common case of lists without any references to other options.
+        """
+        if 'raw' in kwargs or 'vars' in kwargs:
+            return self.get(section=section, option=option, **kwargs)
         _value: str = self.get(
             section=section,
             option=option,
+            raw=True,
             **kwargs
         )
+        if isinstance(_value, str) and ('%' in _value or '$' in _value):
+            _value = self.get(section=section, option=option, **kwargs)
+        return _value
+    ###END def ConfigParserListMixin._get_list_value
+
+    @staticmethod
+    def _split_list_value(
+        value: str,
+        list_separator: str,
+        strip_items: bool
+    ) -> tp.List[str]:
+        """Splits a list-valued option value into items.
+
+        Uses `str.splitlines` for the default newline separator when items
+        are stripped, which does not produce an empty item for a trailing
+        newline. Other separators, and unstripped items (where the empty items
+        are kept), use `str.split`.
+        """
+        if strip_items and list_separator == '\n':
+            return value.splitlines()
+        return value.split(list_separator)
+    ###END def ConfigParserListMixin._split_list_value
+
+    @staticmethod
+    def _list_cache_key(
+        section: str,
+        option: str,
+        list_separator: str,
+        strip_items: bool,
+        item_type: type,
+        dedupe: bool,
+        kwargs: tp.Dict[str, tp.Any]
+    ) -> tp.Optional[tp.Tuple]:
+        """Returns the key for a list in `self._list_cache`, or None if the
+        keyword arguments to `ConfigParser.get` are not hashable (e.g., if
+        `vars` is given), in which case the list should not be cached."""
+        _key: tp.Tuple = (
+            section,
+            option,
+            list_separator,
+            strip_items,
+            item_type,
+            dedupe,
+            tuple(sorted(kwargs.items()))
+        )
+        try:
+            hash(_key)
+        except TypeError:
+            return None
+        return _key
+    ###END def ConfigParserListMixin._list_cache_key
+
+    def _parse_list(
+        self,
+        section: str,
+        option: str,
+        list_separator: str,
+        strip_items: bool,
+        item_type: type,
+        dedupe: bool,
+        **kwargs
+    ) -> tp.List[tp.Any]:
+        """Gets and parses a list-valued option, without caching. See
+        `getlist` for the parameters."""
+        _value: str = self._get_list_value(section, option, **kwargs)
+        _parts: tp.List[str] = self._split_list_value(
+            _value,
+            list_separator,
+            strip_items
+        )
         if strip_items:
-            _value = _value.strip()
-        _valuelist: tp.List[str] = _value.split(list_separator)
-        if strip_items:
-            _valuelist = [_s.strip() for _s in _valuelist]
-        if item_type != str:
-            return [item_type(_item) for _item in _valuelist]
-        else:
-            return _valuelist
-    ###END def ConfigParserListMixin.getlist
+            # Strip and drop empty items in a single pass. Stripping each item
+            # also covers stripping the value as a whole.
+            _parts = [_s for _s in (_p.strip() for _p in _parts) if _s]
+        if dedupe:
+            _parts = list(dict.fromkeys(_parts))
+        if item_type is str:
+            # Config lists often repeat the same tokens, so intern them to
+            # share storage and speed up comparisons and dict lookups.
+            return [sys.intern(_p) for _p in _parts]
+        return list(map(item_type, _parts))
+    ###END def ConfigParserListMixin._parse_list
 
 ###END class ConfigParserListMixin
 
@@ -205,6 +505,12 @@ class PathConfigParser(ConfigParserListMixin):
             Remaining keyword arguments, which will be passed to
             `configparser.ConfigParser.__init__`.
         """
+        # Cached value of `self.root_path`, only valid if
+        # `self._root_path_dirty` is False.
+        self._root_path_cache: tp.Optional[Path] = None
+        self._root_path_dirty: bool = True
+        # Cache of paths returned by `get_path`
+        self._path_cache: tp.Dict[tp.Tuple, Path] = {}
         super().__init__(**kwargs)
         if root_path_option_name is None:
             self.root_path_option_name: str = self._DEFAULT_ROOT_PATH_OPTION
@@ -214,10 +520,17 @@ class PathConfigParser(ConfigParserListMixin):
             self.root_path: Path = root_path
     ###END def PathConfigParser.__init__
 
+    def _clear_caches(self) -> None:
+        super()._clear_caches()
+        self._root_path_dirty = True
+        self._path_cache.clear()
+    ###END def PathConfigParser._clear_caches
+
     def read(
         self,
         filenames: tp.Union[str, Path],
-        encoding: tp.Optional[str] = None
+        encoding: tp.Optional[str] = None,
+        resolve_symlinks: bool = False
     ) -> tp.List[str]:
         """Overriding `read` method, with functionality for setting root_path.
         
@@ -233,6 +546,11 @@ class PathConfigParser(ConfigParserListMixin):
             supported.
         encoding : str, optional
             File encoding, passed to the superclass `read` method.
+        resolve_symlinks : bool, optional
+            Whether to resolve symlinks in the directory of the file when it
+            is used as the default root path. If False, the absolute path of
+            the directory is used as is, which avoids file system lookups for
+            each path component. Optional, False by default.
 
         Returns
         -------
@@ -240,46 +558,146 @@ class PathConfigParser(ConfigParserListMixin):
             Returns the name of the file that was read, as a single-element
             list, to retain compatibility with the superclass `read` method.
         """
-        # Back up self.root_path in case it is set in the file
-        _root_path_backup: Path = self.root_path
-        if not (isinstance(filenames, str) or isinstance(filenames, Path)):
+        _file_path: Path
+        if isinstance(filenames, Path):
+            _file_path = filenames
+        elif isinstance(filenames, str):
+            _file_path = Path(filenames)
+        else:
             raise TypeError(
                 '`filenames` must be a single string or a Path instance.'
             )
-        super().read(filenames=filenames, encoding=encoding)
+        # Back up self.root_path in case it is set in the file
+        _root_path_backup: Path = self.root_path
+        # Get the parsed contents of the file from a cache keyed on its
+        # modification time and size, so that rereading an unchanged file
+        # does not parse it again. Missing or unreadable files are left to
+        # the superclass `read` method, which skips them.
+        try:
+            _stat: os.stat_result = os.stat(_file_path)
+        except OSError:
+            super().read(filenames=_file_path, encoding=encoding)
+        else:
+            self._read_parsed(
+                _parse_ini(
+                    os.path.abspath(_file_path),
+                    _stat.st_mtime_ns,
+                    _stat.st_size,
+                    encoding,
+                    self._parser_settings()
+                )
+            )
         if _root_path_backup is not None \
                 and _root_path_backup != self.root_path:
-            self.root_path = _root_path_backup
+            self._set_root_path_raw(_root_path_backup)
         if self.root_path is None:
-            self.root_path = Path(filenames).parent.absolute().resolve()
-        return [str(filenames)]
+            self._set_root_path_raw(
+                _file_path.parent.resolve() if resolve_symlinks
+                else os.path.dirname(os.path.abspath(_file_path))
+            )
+        return [str(_file_path)]
     ###END def PathConfigParser.read
 
     @property
     def root_path(self) -> Path:
-        _path: tp.Optional[Path] = self.get(
-            section=self.default_section,
-            option=self.root_path_option_name,
-            fallback=None
+        if not self._root_path_dirty:
+            return self._root_path_cache
+        # Read the raw value directly from the default section, and only go
+        # through `get` (and interpolation) if the value may need it.
+        _path: tp.Optional[str] = self._defaults.get(
+            self.optionxform(self.root_path_option_name)
         )
-        if _path is None:
-            return _path
-        else:
-            return Path(_path)
+        if _path is not None and ('%' in _path or '$' in _path):
+            _path = self.get(
+                section=self.default_section,
+                option=self.root_path_option_name,
+                fallback=None
+            )
+        self._root_path_cache = None if _path is None else Path(_path)
+        self._root_path_dirty = False
+        return self._root_path_cache
     ###END def property PathConfigParser.root_path
 
     @root_path.setter
     def root_path(self, _path: Path):
-        if not (isinstance(_path, str) or isinstance(_path, Path)):
+        if not isinstance(_path, (str, Path)):
             raise TypeError(
                 '`root_path` only supports string and Path values.'
             )
+        self._set_root_path_raw(_path)
+    ###END def property.setter PathConfigParser.set_root_path
+
+    def _read_parsed(
+        self,
+        parsed: tp.Mapping[str, tp.Mapping[str, tp.Optional[str]]]
+    ) -> None:
+        """Stores raw values returned by `_parse_ini` in the parser.
+
+        Works like `RawConfigParser._read` rather than `read_dict`: values are
+        stored directly, without going through `set`, so the interpolation
+        does not validate them (e.g., a lone `%` in a value is accepted, and
+        only raises an error if the value is interpolated). Option names have
+        already been transformed with `optionxform` by `_parse_ini`.
+        """
+        self._clear_caches()
+        _options: tp.Dict[str, tp.Optional[str]]
+        for _section, _values in parsed.items():
+            if _section == self.default_section:
+                _options = self._defaults
+            else:
+                if _section not in self._sections:
+                    self._sections[_section] = self._dict()
+                    self._proxies[_section] = configparser.SectionProxy(
+                        self, _section
+                    )
+                _options = self._sections[_section]
+            for _option, _value in _values.items():
+                if _value is not None:
+                    _value = self._interpolation.before_read(
+                        self, _section, _option, _value
+                    )
+                _options[_option] = _value
+    ###END def PathConfigParser._read_parsed
+
+    def _parser_settings(self) -> tp.Tuple:
+        """Returns the settings that determine how a file is parsed, in the
+        order of the parameters of `_parse_ini`.
+
+        `optionxform` is given as the underlying function (and a flag for
+        whether it is a method) rather than as a bound method, so that the
+        settings do not hold a reference to `self` in the `_parse_ini` cache,
+        and are the same for all instances of a class.
+        """
+        _optionxform: tp.Callable = self.optionxform
+        _optionxform_is_method: bool = isinstance(
+            _optionxform, types.MethodType
+        ) and _optionxform.__self__ is self
+        if _optionxform_is_method:
+            _optionxform = _optionxform.__func__
+        return (
+            self._delimiters,
+            self._comment_prefixes,
+            self._inline_comment_prefixes,
+            self._strict,
+            self._empty_lines_in_values,
+            self.default_section,
+            self._allow_no_value,
+            self.SECTCRE,
+            self._optcre,
+            _optionxform,
+            _optionxform_is_method
+        )
+    ###END def PathConfigParser._parser_settings
+
+    def _set_root_path_raw(self, _path: tp.Union[str, Path]) -> None:
+        """Sets the root path without type checking. For internal use where
+        `_path` is known to be a str or Path."""
         self.set(
             section=self.default_section,
             option=self.root_path_option_name,
             value=str(_path)
         )
-    ###END def property.setter PathConfigParser.set_root_path
+    ###END def PathConfigParser._set_root_path_raw
 
     def get_path(
         self,
@@ -314,6 +732,9 @@ class PathConfigParser(ConfigParserListMixin):
         -------
         Path
             The option interpreted as a path, as a `pathlib.Path` instance.
+            Paths are cached until the configuration is changed, so changes in
+            the file system (e.g., to symlinks) after the first call will not
+            be reflected in the resolved path.
 
         Raises
         ------
@@ -322,6 +743,20 @@ class PathConfigParser(ConfigParserListMixin):
         """
         if root_path is None:
             root_path = self.root_path
+        _cache_key: tp.Optional[tp.Tuple] = (
+            section,
+            option,
+            return_absolute,
+            root_path,
+            tuple(sorted(kwargs.items()))
+        )
+        try:
+            return self._path_cache[_cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable keyword arguments (e.g., `vars`), don't cache
+            _cache_key = None
         _path: Path = Path(
             self.get(
                 section=section,
@@ -330,8 +765,70 @@ class PathConfigParser(ConfigParserListMixin):
             )
         )
         if return_absolute and not _path.is_absolute():
-            _path = (root_path / _path).absolute().resolve()
+            _path = (root_path / _path).resolve()
+        if _cache_key is not None:
+            self._path_cache[_cache_key] = _path
         return _path
     ###END def PathConfigParser.get_path
 
 ###END class PathConfigParser
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_ini(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    encoding: tp.Optional[str],
+    settings: tp.Tuple
+) -> tp.Dict[str, tp.Dict[str, tp.Optional[str]]]:
+    """Parses a config file into a nested dict of raw (uninterpolated) values.
+
+    The result is cached, and `mtime_ns` and `size` are only used as part of
+    the cache key, so that the file is parsed again if it has changed.
+    `settings` is the tuple returned by `PathConfigParser._parser_settings`,
+    and includes the section and option regexes and the `optionxform`
+    function to parse with. The returned dict must not be modified. It includes the default section, and is stored in a
+    parser by `PathConfigParser._read_parsed`.
+    """
+    (
+        delimiters,
+        comment_prefixes,
+        inline_comment_prefixes,
+        strict,
+        empty_lines_in_values,
+        default_section,
+        allow_no_value,
+        sectcre,
+        optcre,
+        optionxform,
+        optionxform_is_method
+    ) = settings
+    parser: configparser.RawConfigParser = configparser.RawConfigParser(
+        delimiters=delimiters,
+        comment_prefixes=comment_prefixes,
+        inline_comment_prefixes=inline_comment_prefixes,
+        strict=strict,
+        empty_lines_in_values=empty_lines_in_values,
+        default_section=default_section,
+        allow_no_value=allow_no_value,
+        interpolation=None
+    )
+    # Parse with the regexes and `optionxform` of the parser that the result
+    # is read into, so that option names are transformed (and duplicates
+    # detected in strict mode) in the same way as by its own `read` method.
+    parser.SECTCRE = sectcre
+    parser._optcre = optcre
+    parser.optionxform = types.MethodType(optionxform, parser) \
+        if optionxform_is_method else optionxform
+    with open(path, encoding=encoding) as _f:
+        parser.read_file(_f, source=path)
+    # Use `_sections` rather than `items`, which would also include the
+    # defaults in each section.
+    parsed: tp.Dict[str, tp.Dict[str, tp.Optional[str]]] = {
+        default_section: dict(parser.defaults())
+    }
+    for _section, _options in parser._sections.items():
+        parsed[_section] = dict(_options)
+    return parsed
+###END def _parse_ini
@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 import typing as tp
+import os
 import enum
+import configparser
 from pathlib import Path
+import concurrent.futures
+import hashlib
+import inspect
+import pickle
 from abc import ABC, abstractmethod, abstractproperty
 import functools
+import importlib.util
 
 import pandas as pd
 
@@ -19,6 +26,11 @@ ColumnAdjustment = tp.Callable[[pd.Series], pd.Series]
 GlobalAdjustment = tp.Callable[[pd.DataFrame], pd.DataFrame]
 ClosedIntervalSpec = tp.Literal['left', 'right', 'both', 'neither']
 
+# Whether `pyarrow` is installed, to use the pyarrow engine of
+# `pandas.read_csv` in `PandasDataLoader` when `fast_io` is True. Checked
+# without importing `pyarrow` itself, which is slow to import.
+_PYARROW_AVAILABLE: bool = importlib.util.find_spec('pyarrow') is not None
+
 
 
 @enum.unique
@@ -115,7 +127,7 @@ class DataConfig(PathConfigParser):
 class DataLoader(ABC):
     """Abstract base class for loading and processing raw and cached data."""
 
-    __slots__ = ('data_config', )
+    __slots__ = ('data_config', '_resolved_processors')
 
     @abstractproperty
     def data_processor(self) -> tp.Union[
@@ -173,6 +185,9 @@ class DataLoader(ABC):
             data_config_str=data_config_str,
             allow_empty=True
         )
+        self._resolved_processors: tp.Dict[
+            tp.Optional[DataReprType], tp.Callable
+        ] = {}
     ###END def DataLoader.__init__
 
     class NoDataConfigError(Exception):
@@ -251,7 +266,11 @@ class DataLoader(ABC):
             Type of data representation object to be returned.
         cache_processed_data : bool = True
             Whether to store processed data in a cached version that can be
-            read directly later without reprocessing the raw data files.
+            read directly later without reprocessing the raw data files. Only
+            has an effect if `self.get_processed_cache_path` returns a path,
+            which the base class implementation never does. If a cache file
+            exists at that path, it is returned directly, without reading or
+            processing the raw data files.
         file_getter_kwargs : dict from str to any, optional
             Keyword arguments to pass to `self.get_raw_datafile_paths`
             (abstract method to be implemented by subclasses).
@@ -282,14 +301,65 @@ class DataLoader(ABC):
                 data_config=data_config,
                 **file_getter_kwargs
             )
+        # Return cached processed data if present, or get the path to cache it
+        cache_path: tp.Optional[Path] = None
+        if cache_processed_data:
+            cache_path = self.get_processed_cache_path(
+                datafiles=data_file_paths,
+                data_config=data_config,
+                data_repr=data_repr,
+                data_processor_kwargs=data_processor_kwargs
+            )
+            if cache_path is not None and cache_path.is_file():
+                try:
+                    return self.read_processed_cache(cache_path)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    # Unreadable cache file, reprocess and overwrite it
+                    pass
         # Read the data files
         raw_data = self.read_raw_datafiles(
             datafiles=data_file_paths,
             data_config=data_config
         )
         # Get the right data processor to use
+        process_data: tp.Callable = self._get_processor(data_repr)
+        processed_data = process_data(
+            raw_data=raw_data,
+            data_config=data_config,
+            caller=self,
+            **data_processor_kwargs
+        )
+        if cache_path is not None:
+            try:
+                self.write_processed_cache(processed_data, cache_path)
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                # Failing to write the cache (e.g., an unwritable directory
+                # or unpicklable data) should not fail the load itself.
+                pass
+        return processed_data
+    ###END def DataLoader.load_raw_dataset
+
+    def _get_processor(
+        self,
+        data_repr: tp.Optional[DataReprType] = None
+    ) -> tp.Callable:
+        """Get the data processor function to use for `data_repr`.
+
+        The processor is resolved from `self.data_processor` on the first call
+        for each `data_repr`, and then cached on the instance. Subclasses whose
+        `data_processor` can change after initialization must clear
+        `self._resolved_processors` when it does.
+        """
+        try:
+            return self._resolved_processors[data_repr]
+        except KeyError:
+            pass
+        data_processor: tp.Union[
+            tp.Mapping[DataReprType, tp.Callable],
+            tp.Callable
+        ] = self.data_processor
         process_data: tp.Callable
-        if isinstance(self.data_processor, tp.Mapping):
+        if isinstance(data_processor, tp.Mapping):
             if data_repr is None:
                 raise ValueError(
                     '`data_repr` must be specified when `self.data_processor` '
@@ -297,7 +367,7 @@ class DataLoader(ABC):
                     'processor functions.'
                 )
             try:
-                process_data = self.data_processor[data_repr]
+                process_data = data_processor[data_repr]
             except KeyError as ke:
                 if (len(ke.args) != 1) or (ke.args[0] != data_repr):
                     raise ke
@@ -306,15 +376,78 @@ class DataLoader(ABC):
                     f'representation type {data_repr}.'
                 )
         else:
-            process_data = self.data_processor
-        processed_data = process_data(
-            raw_data=raw_data,
-            data_config=data_config,
-            caller=self,
-            **data_processor_kwargs
+            process_data = data_processor
+        self._resolved_processors[data_repr] = process_data
+        return process_data
+    ###END def DataLoader._get_processor
+
+    def get_processed_cache_path(
+        self,
+        datafiles: tp.Union[Path, tp.Sequence[Path]],
+        data_config: tp.Optional[DataConfig] = None,
+        data_repr: tp.Optional[DataReprType] = None,
+        data_processor_kwargs: tp.Optional[tp.Dict[str, tp.Any]] = None
+    ) -> tp.Optional[Path]:
+        """Get the path of the cache file for processed data.
+
+        Called by `load_raw_dataset` if `cache_processed_data` is True. The base
+        class implementation returns None, which disables caching. Subclasses
+        that support caching should return a path that changes whenever the
+        processed data would change, e.g., by using `make_cache_key`.
+
+        Parameters
+        ----------
+        datafiles : Path or sequence of Path
+            The raw data file(s), as returned by `self.get_raw_datafile_paths`.
+        data_config : DataConfig, optional
+            The configuration that will be passed to `self.read_raw_datafiles`
+            and the data processor.
+        data_repr : DataReprType, optional
+            The requested data representation type.
+        data_processor_kwargs : dict from str to any, optional
+            The keyword arguments that will be passed to the data processor.
+
+        Returns
+        -------
+        Path or None
+            Path of the cache file (which need not exist yet), or None if the
+            processed data should not be cached.
+        """
+        return None
+    ###END def DataLoader.get_processed_cache_path
+
+    def read_processed_cache(self, cache_path: Path) -> tp.Any:
+        """Read processed data from a cache file written by
+        `write_processed_cache`.
+
+        The base class implementation uses `pickle`, which can store any
+        picklable data object, and preserves dtypes and indexes of pandas
+        objects exactly. Only read cache files that you have written yourself.
+        """
+        with open(cache_path, 'rb') as _file:
+            return pickle.load(_file)
+    ###END def DataLoader.read_processed_cache
+
+    def write_processed_cache(self, data: tp.Any, cache_path: Path) -> None:
+        """Write processed data to a cache file to be read by
+        `read_processed_cache`.
+
+        The file is first written to a temporary file in the same directory,
+        and then moved into place, so that an interrupted write never leaves a
+        partial cache file behind.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _tmp_path: Path = cache_path.with_name(
+            f'{cache_path.name}.{os.getpid()}.tmp'
         )
-        return processed_data
-    ###END def DataLoader.load_raw_dataset
+        try:
+            with open(_tmp_path, 'wb') as _file:
+                pickle.dump(data, _file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(_tmp_path, cache_path)
+        finally:
+            if _tmp_path.exists():
+                _tmp_path.unlink()
+    ###END def DataLoader.write_processed_cache
 
     @abstractmethod
     def get_raw_datafile_paths(
@@ -544,6 +677,127 @@ def set_nonna_if_not_present(
             return None
 ###END set_nonna_if_not_present
 
+
+def _dtype_matches(
+    current_dtype: tp.Optional[tp.Any],
+    target_dtype: tp.Union[str, type, tp.Any]
+) -> bool:
+    """Check whether `current_dtype` is exactly the dtype that `target_dtype`
+    resolves to, so that converting to `target_dtype` would be a no-op. Returns
+    False if `current_dtype` is None or `target_dtype` is not a valid dtype."""
+    if current_dtype is None:
+        return False
+    try:
+        return pd.api.types.pandas_dtype(target_dtype) == current_dtype
+    except TypeError:
+        return False
+###END def _dtype_matches
+
+
+def callable_cache_repr(func: tp.Callable) -> tp.Optional[tp.Any]:
+    """Get a representation of a callable that is stable between sessions.
+
+    Used to include functions (such as data adjustments) in cache keys, since
+    the default `repr` of functions includes their memory address. Functions
+    and classes are represented by their module and qualified name together
+    with a digest of their source code (so that edits to the function body
+    are detected), and `functools.partial` objects by the representation of
+    the wrapped function together with the bound arguments.
+
+    Returns None for callables that cannot be identified: lambdas and
+    functions or classes defined inside functions (whose qualified names
+    contain `'<'`, and are shared by different functions), callables without
+    a qualified name (e.g., callable instances), and callables whose source
+    code is not available (e.g., builtins). Data that depends on such
+    callables should not be cached.
+    """
+    if isinstance(func, functools.partial):
+        _func_repr: tp.Optional[tp.Any] = callable_cache_repr(func.func)
+        if _func_repr is None:
+            return None
+        return (
+            _func_repr,
+            func.args,
+            sorted(func.keywords.items())
+        )
+    _qualname: tp.Optional[str] = getattr(func, '__qualname__', None)
+    if _qualname is None or '<' in _qualname:
+        return None
+    try:
+        _source: str = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+    return (
+        f'{getattr(func, "__module__", None)}.{_qualname}',
+        hashlib.blake2b(_source.encode(), digest_size=8).hexdigest()
+    )
+###END def callable_cache_repr
+
+
+def config_cache_repr(config: configparser.RawConfigParser) -> tp.Any:
+    """Get a representation of the contents of a config parser, to include
+    in cache keys.
+
+    Uses the raw (uninterpolated) values of the default section and of each
+    section, so that any change to the configuration changes the
+    representation.
+    """
+    return (
+        sorted(config.defaults().items()),
+        [
+            (_section, sorted(config._sections[_section].items()))
+            for _section in config.sections()
+        ]
+    )
+###END def config_cache_repr
+
+
+def make_cache_key(
+    datafiles: tp.Union[Path, tp.Sequence[Path]],
+    *key_parts: tp.Any,
+    digest_size: int = 8
+) -> tp.Optional[str]:
+    """Make a cache key for processed data from raw data files.
+
+    The key is a hash of the absolute paths, modification times and sizes of
+    the data files, and of the `repr` of any additional key parts, so it
+    changes whenever any of the files or any of the key parts change.
+
+    Parameters
+    ----------
+    datafiles : Path or sequence of Path
+        The raw data file(s) that the processed data is made from.
+    *key_parts
+        Additional objects that the processed data depends on, such as dtypes
+        and adjustment functions. Must have a `repr` that is stable between
+        sessions (use `callable_cache_repr` for functions).
+    digest_size : int, optional
+        Size of the hash digest in bytes. The returned key is twice as many
+        hexadecimal characters. Optional, 8 by default.
+
+    Returns
+    -------
+    str or None
+        Hexadecimal cache key, or None if any of the files cannot be accessed.
+    """
+    if isinstance(datafiles, (Path, str)):
+        datafiles = [datafiles]
+    _file_keys: tp.List[tp.Tuple[str, int, int]] = []
+    _stat: os.stat_result
+    for _path in datafiles:
+        try:
+            _stat = os.stat(_path)
+        except OSError:
+            return None
+        _file_keys.append(
+            (os.path.abspath(_path), _stat.st_mtime_ns, _stat.st_size)
+        )
+    return hashlib.blake2b(
+        repr((_file_keys, key_parts)).encode(),
+        digest_size=digest_size
+    ).hexdigest()
+###END def make_cache_key
+
 class PandasDataLoader(DataLoader):
     """DataLoader class for processing tabular/CSV-style data to DataFrames.
     
@@ -556,10 +810,10 @@ class PandasDataLoader(DataLoader):
       * `data_processor`
 
     Also, the `read_raw_datafiles` simply reads a list of CSV files into
-    DataFrames with `pandas.read_csv` without any custom arguments, and
-    concatenates the DataFrames together in order of appearance. If any
-    customized behavior is needed, `read_raw_datafiles` will also need to be
-    overridden in a subclass.
+    DataFrames with `pandas.read_csv` without any custom arguments (except
+    `engine='pyarrow'` if `fast_io` is True), and concatenates the DataFrames
+    together in order of appearance. If any customized behavior is needed,
+    `read_raw_datafiles` will also need to be overridden in a subclass.
     """
 
     __slots__ = (
@@ -567,7 +821,9 @@ class PandasDataLoader(DataLoader):
         'data_index_cols',
         'global_preadjustments',
         'column_adjustments',
-        'global_postadjustments'
+        'global_postadjustments',
+        'cache_dir',
+        'fast_io'
     )
 
     def __init__(
@@ -586,7 +842,9 @@ class PandasDataLoader(DataLoader):
             ]
         ] = None,
         global_postadjustments: tp.Optional[tp.Sequence[GlobalAdjustment]] = \
-            None
+            None,
+        cache_dir: tp.Optional[tp.Union[Path, str]] = None,
+        fast_io: tp.Optional[bool] = None
     ):
         """
         Parameters
@@ -621,6 +879,18 @@ class PandasDataLoader(DataLoader):
         global_postadjustments : sequence of callables, optional
             Adjustments to make to the whole DataFrame after other processing,
             before returning.
+        cache_dir : Path or str, optional
+            Directory to store processed data in, when `load_raw_dataset` is
+            called with `cache_processed_data=True`. Cached data is reused
+            as long as the raw data files, dtypes, index columns, adjustments
+            and data processor keyword arguments are unchanged. Optional, no
+            caching by default.
+        fast_io : bool, optional
+            Whether `read_raw_datafiles` should use the multithreaded pyarrow
+            CSV parser (`engine='pyarrow'` in `pandas.read_csv`). Has no effect
+            if `pyarrow` is not installed. Note that the pyarrow parser infers
+            some dtypes differently from the default parser (e.g., it parses
+            timestamps into datetime columns). Optional, False by default.
         """
         super().__init__(
             data_config=data_config,
@@ -670,20 +940,127 @@ class PandasDataLoader(DataLoader):
             if not hasattr(self, 'column_adjustments'):
                 self.column_adjustments = dict()
         # Ensure that `self.column_adjustments` has sequences of callables, and
-        # and no scalars.
+        # and no scalars. Single callables are wrapped in a tuple.
         # Then set a type hint, since we now know that all elements in
         # self.column_adjustments are sequences.
         for _key, _value in self.column_adjustments.items():
-            if not isinstance(_value, tp.Sequence):
-                self.column_adjustments[_key] = [_value]
+            if callable(_value):
+                self.column_adjustments[_key] = (_value,)
         self.column_adjustments: tp.Dict[tp.Hashable, tp.Sequence[ColumnAdjustment]]
         if global_postadjustments is not None:
             self.global_postadjustments = global_postadjustments
         else:
             if not hasattr(self, 'global_postadjustments'):
                 self.global_postadjustments = list()
+        self.cache_dir: tp.Optional[Path]
+        set_nonna_if_not_present(
+            self,
+            attr_name='cache_dir',
+            attr_value=Path(cache_dir) if cache_dir is not None else None,
+            default_value=None
+        )
+        self.fast_io: bool
+        set_nonna_if_not_present(
+            self,
+            attr_name='fast_io',
+            attr_value=fast_io,
+            default_value=False
+        )
     ###END def PandasDataLoader.__init__
 
+    def get_processed_cache_path(
+        self,
+        datafiles: tp.Union[Path, tp.Sequence[Path]],
+        data_config: tp.Optional[DataConfig] = None,
+        data_repr: tp.Optional[DataReprType] = None,
+        data_processor_kwargs: tp.Optional[tp.Dict[str, tp.Any]] = None
+    ) -> tp.Optional[Path]:
+        """Get the path of the cache file for processed data in
+        `self.cache_dir`.
+
+        The file name contains a key made with `make_cache_key` from the data
+        files, the contents of `data_config` (by default `self.data_config`),
+        the class, `data_repr`, `data_processor_kwargs`, and the dtypes, index
+        columns and adjustments of `self`. Classes and adjustments are keyed
+        on their names and source code. Returns None (no caching) if
+        `self.cache_dir` is None, any of the data files cannot be accessed, or
+        the class or any of the adjustments cannot be identified by
+        `callable_cache_repr` (e.g., lambdas or functions without available
+        source code).
+        """
+        if self.cache_dir is None:
+            return None
+        if data_config is None:
+            data_config = self.data_config
+        class_repr: tp.Optional[str] = callable_cache_repr(type(self))
+        preadjustment_reprs: tp.List[tp.Optional[tp.Any]] = [
+            callable_cache_repr(_f) for _f in self.global_preadjustments
+        ]
+        column_adjustment_reprs: tp.List[
+            tp.Tuple[str, tp.List[tp.Optional[tp.Any]]]
+        ] = sorted(
+            (
+                str(_colname),
+                [callable_cache_repr(_f) for _f in _col_adjustments]
+            )
+            for _colname, _col_adjustments in self.column_adjustments.items()
+        )
+        postadjustment_reprs: tp.List[tp.Optional[tp.Any]] = [
+            callable_cache_repr(_f) for _f in self.global_postadjustments
+        ]
+        if class_repr is None \
+                or None in preadjustment_reprs \
+                or None in postadjustment_reprs \
+                or any(
+                    None in _reprs for _, _reprs in column_adjustment_reprs
+                ):
+            return None
+        cache_key: tp.Optional[str] = make_cache_key(
+            datafiles,
+            class_repr,
+            config_cache_repr(data_config),
+            data_repr,
+            sorted(
+                (data_processor_kwargs or {}).items(),
+                key=lambda _item: _item[0]
+            ),
+            sorted(
+                self.source_data_dtypes.items(),
+                key=lambda _item: str(_item[0])
+            ),
+            list(self.data_index_cols),
+            self.fast_io and _PYARROW_AVAILABLE,
+            preadjustment_reprs,
+            column_adjustment_reprs,
+            postadjustment_reprs
+        )
+        if cache_key is None:
+            return None
+        return Path(self.cache_dir) / f'{type(self).__name__}_{cache_key}.pkl'
+    ###END def PandasDataLoader.get_processed_cache_path
+
+    def read_raw_datafiles(
+        self,
+        datafiles: tp.Union[Path, tp.Sequence[Path]],
+        data_config: tp.Optional[DataConfig] = None
+    ) -> pd.DataFrame:
+        """Read CSV data files with `pandas.read_csv` and concatenate them.
+
+        Uses `engine='pyarrow'` if `self.fast_io` is True and `pyarrow` is
+        installed. Override in subclasses that need to pass other arguments to
+        `pandas.read_csv` or read other file formats (e.g., by calling
+        `self._read_and_concat_datafiles` with a different `read_func`).
+        """
+        read_kwargs: tp.Dict[str, tp.Any] = {}
+        if self.fast_io and _PYARROW_AVAILABLE:
+            read_kwargs['engine'] = 'pyarrow'
+        return self._read_and_concat_datafiles(
+            datafiles,
+            read_func=pd.read_csv,
+            **read_kwargs
+        )
+    ###END def PandasDataLoader.read_raw_datafiles
+
     @staticmethod
     def process_raw_df(
         raw_data: pd.DataFrame,
@@ -716,7 +1093,17 @@ class PandasDataLoader(DataLoader):
         # Get type conversion specs
         dtypes: tp.Mapping[str, tp.Union[str, type]] = \
             caller.source_data_dtypes
-        _df: pd.DataFrame = raw_data.astype(dtypes)
+        # Only convert columns that do not already have the target dtype (e.g.,
+        # if the reader was given the dtypes). Columns that are missing or
+        # have duplicate names are passed on, to get the usual errors.
+        if dtypes and raw_data.columns.is_unique:
+            _raw_dtypes: tp.Mapping[tp.Hashable, tp.Any] = \
+                raw_data.dtypes.to_dict()
+            dtypes = {
+                _col: _dtype for _col, _dtype in dtypes.items()
+                if not _dtype_matches(_raw_dtypes.get(_col), _dtype)
+            }
+        _df: pd.DataFrame = raw_data.astype(dtypes) if dtypes else raw_data
 
         # Global and column-wise adjustments
         # First type definitions
@@ -732,13 +1119,23 @@ class PandasDataLoader(DataLoader):
         # Then make the adjustments
         for _global_adjustment in global_preadjustments:
             _df = _global_adjustment(_df)
-        _colname: tp.Hashable
-        for _colname, _col_adjustments in column_adjustments.items():
+        # Compute all the adjusted columns first, and then insert them into a
+        # single shallow copy of the DataFrame (like `DataFrame.assign`, but
+        # allowing column names that are not str), rather than making a new
+        # copy of the DataFrame after each column.
+        if column_adjustments:
+            _colname: tp.Hashable
             _col_adjustment: ColumnAdjustment
-            for _col_adjustment in _col_adjustments:
-                _df[_colname] = _col_adjustment(_df[_colname])
-            # Make a copy to remove any unnecessary fragmentation
+            _column: pd.Series
+            adjusted_columns: tp.Dict[tp.Hashable, pd.Series] = {}
+            for _colname, _col_adjustments in column_adjustments.items():
+                _column = _df[_colname]
+                for _col_adjustment in _col_adjustments:
+                    _column = _col_adjustment(_column)
+                adjusted_columns[_colname] = _column
             _df = _df.copy(deep=False)
+            for _colname, _column in adjusted_columns.items():
+                _df[_colname] = _column
         for _global_adjustment in global_postadjustments:
             _df = _global_adjustment(_df)
         
@@ -799,7 +1196,8 @@ class PandasDataLoader(DataLoader):
         """
         if interval_cols is None:
             interval_cols = kwargs
-        interval_cols.update(kwargs)
+        elif kwargs:
+            interval_cols = {**interval_cols, **kwargs}
         if isinstance(closed, str) or closed is None:
             if isinstance(closed, str) and len(interval_cols) > 1:
                 raise ValueError(
@@ -810,30 +1208,27 @@ class PandasDataLoader(DataLoader):
             closed = {
                 k: _closed for k in interval_cols.keys()
             }
-        _newcols: tp.List[pd.Series] = list()
-        for target_col, source_cols in interval_cols.items():
-            _newcols.append(
-                pd.IntervalIndex.from_arrays(
-                    left=df[source_cols[0]],
-                    right=df[source_cols[1]],
+        # Build the interval columns directly as Series on the index of `df`,
+        # rather than through an `IntervalIndex` and `to_series`.
+        _newcols: tp.Dict[str, pd.Series] = {
+            target_col: pd.Series(
+                pd.arrays.IntervalArray.from_arrays(
+                    left=df[source_cols[0]].array,
+                    right=df[source_cols[1]].array,
                     closed=closed[target_col]
-                ).to_series(
-                    index=df.index,
-                    name=target_col
-                )
+                ),
+                index=df.index,
+                name=target_col,
+                copy=False
             )
+            for target_col, source_cols in interval_cols.items()
+        }
         if drop:
             dropcols = [x[0] for x in interval_cols.values()] + \
                 [x[1] for x in interval_cols.values()]
         else:
             dropcols = []
-        newdf: pd.DataFrame = pd.concat(
-            [
-                df.drop(columns=dropcols),
-                *_newcols,
-            ],
-            axis=1
-        )
+        newdf: pd.DataFrame = df.drop(columns=dropcols).assign(**_newcols)
         return newdf
     ###END def staticmethod PandasDataLoader.set_intervals
 
@@ -841,11 +1236,17 @@ class PandasDataLoader(DataLoader):
         self,
         datafile_paths: tp.Union[Path, tp.Sequence[Path]],
         read_func: tp.Callable[[Path], pd.DataFrame],
+        max_workers: tp.Optional[int] = None,
+        use_source_dtypes: bool = False,
         **kwargs
     ) -> pd.DataFrame:
         """Helper function to read multiple data files into DataFrames and
         return the concatenated result. Useful helper file for implementing a
         `read_raw_datafiles` method in subclasses.
+
+        Multiple files are read in parallel in a thread pool. The pandas
+        readers (and e.g. `pandas.read_csv` with `engine='pyarrow'`) release
+        the GIL while parsing, so this speeds up reading many files.
         
         Parameters
         ----------
@@ -855,7 +1256,21 @@ class PandasDataLoader(DataLoader):
             Function that accepts a Path and optional keyword arguments, and
             returns a DataFrame. Will be used to read the data files into
             DataFrames to be concatenated. E.g., pass `pandas.read_csv` to
-            read CSV files, or `pandas.read_excel` to read Excel files.
+            read CSV files, or `pandas.read_excel` to read Excel files. Must be
+            thread-safe if more than one file is read.
+        max_workers : int, optional
+            Maximum number of threads to use for reading files. Optional, by
+            default the number of files, up to the number of CPUs. Pass 1 to
+            read the files sequentially in the calling thread.
+        use_source_dtypes : bool, optional
+            Whether to pass `self.source_data_dtypes` to `read_func` as the
+            `dtype` keyword argument (unless `dtype` is given explicitly in
+            `kwargs`). With readers that support it (such as
+            `pandas.read_csv`), the columns are then parsed directly into the
+            final dtypes, and the type conversion in `process_raw_df` becomes
+            a no-op, rather than first materializing the data with inferred
+            dtypes and then converting a second time. Optional, False by
+            default.
         **kwargs
             Optional keyword arguments, will be passed to `read_func` after a
             positional `Path` argument.
@@ -866,10 +1281,21 @@ class PandasDataLoader(DataLoader):
             raise TypeError(
                 '`datafile_paths` must be a Path or sequence of Path objects.'
             )
-        _path: Path
-        df_list: tp.List[pd.DataFrame] = list()
-        for _path in datafile_paths:
-            df_list.append(read_func(_path, **kwargs))
+        if use_source_dtypes and self.source_data_dtypes:
+            kwargs.setdefault('dtype', dict(self.source_data_dtypes))
+        if max_workers is None:
+            max_workers = min(len(datafile_paths), os.cpu_count() or 1)
+        _read: tp.Callable[[Path], pd.DataFrame] = \
+            functools.partial(read_func, **kwargs)
+        df_list: tp.List[pd.DataFrame]
+        if max_workers <= 1 or len(datafile_paths) <= 1:
+            df_list = [_read(_path) for _path in datafile_paths]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+            ) as _executor:
+                # `map` returns the results in the order of the paths
+                df_list = list(_executor.map(_read, datafile_paths))
         return pd.concat(df_list, axis=0)
     ###END def PandasDataLoader._read_and_concat_datafiles
 
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import typing as tp
+import sys
 import dataclasses
 import collections
+import functools
+import operator
 
 import pandas as pd
 import numpy as np
@@ -27,6 +30,10 @@ def dictify_dataclass(_class: DC) -> DC:
         attr2: type = default2
         ...
     ```
+
+    The dict methods `keys`, `values` and `items` list the dataclass fields.
+    `values` returns the field values themselves (not copies, unlike
+    `dataclasses.astuple`).
     """
     if not hasattr(_class, '__getitem__'):
         _class.__getitem__ = lambda self, key: getattr(self, key)
@@ -35,11 +42,13 @@ def dictify_dataclass(_class: DC) -> DC:
     if not hasattr(_class, '__delitem__'):
         _class.__delitem__ = lambda self, key: delattr(self, key)
     def get_field_names(self):
-        return tuple([_field.name for _field in dataclasses.fields(self)])
+        return _dataclass_field_names(type(self))
+    def get_field_values(self):
+        return _dataclass_values_getter(type(self))(self)
     if not hasattr(_class, 'keys'):
         _class.keys = get_field_names
     if not hasattr(_class, 'values'):
-        _class.values = dataclasses.astuple
+        _class.values = get_field_values
     def items(self):
         return zip(self.keys(), self.values())
     if not hasattr(_class, 'items'):
@@ -50,6 +59,33 @@ def dictify_dataclass(_class: DC) -> DC:
     return _class
 ###END def dictify
 
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_names(_class: type) -> tp.Tuple[str, ...]:
+    """Returns the field names of a dataclass, cached per class (since
+    `dataclasses.fields` filters all attributes of the class on each call)."""
+    return tuple(
+        sys.intern(_field.name) for _field in dataclasses.fields(_class)
+    )
+###END def _dataclass_field_names
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_values_getter(_class: type) -> tp.Callable[[tp.Any], tp.Tuple]:
+    """Returns a function that gets a tuple of the field values of an instance
+    of the dataclass `_class`, cached per class. Uses `operator.attrgetter`,
+    which fetches all the attributes in a single C-level call."""
+    field_names: tp.Tuple[str, ...] = _dataclass_field_names(_class)
+    if not field_names:
+        return lambda obj: ()
+    getter: operator.attrgetter = operator.attrgetter(*field_names)
+    # `attrgetter` returns a single value rather than a tuple if it only has
+    # one attribute name.
+    if len(field_names) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
+###END def _dataclass_values_getter
+
 @tp.dataclass_transform()
 def dictdataclass(_class: type[DC] = None, **kwargs) \
         -> type[tp.Union[DC, tp.Dict]]:
@@ -70,7 +106,14 @@ def dictdataclass(_class: type[DC] = None, **kwargs) \
     class C:
         ...
     ```
+
+    except that `slots=True` is passed to `dataclasses.dataclass` by default
+    (on Python 3.10 and later), which gives smaller instances and faster
+    attribute (and hence item) access. Pass `slots=False` explicitly if the
+    class needs an instance `__dict__`.
     """
+    if sys.version_info >= (3, 10):
+        kwargs.setdefault('slots', True)
     if _class is not None:
         return dictify_dataclass(dataclasses.dataclass(_class, **kwargs))
     else:
@@ -154,41 +197,96 @@ def dict_to_multi_df(
     index_level_names: tp.List[tp.Hashable]
     column_level_num: int
     column_level_names: tp.List[tp.Hashable]
+    # Levels that are only given by number are left unnamed (None), like
+    # the default in the `pandas.MultiIndex` constructor. Integer names would
+    # clash between the index and column levels.
     if isinstance(index_levels, int):
         index_level_num = index_levels
-        index_level_names = list(range(0, index_level_num-1))
+        index_level_names = [None] * index_level_num
     else:
         index_level_num = len(index_levels)
         index_level_names = list(index_levels)
     if isinstance(column_levels, int):
         column_level_num = column_levels
-        column_level_names = list(range(0, column_level_num))
+        column_level_names = [None] * column_level_num
     else:
         column_level_num = len(column_levels)
         column_level_names = list(column_levels)
     total_level_num: int = index_level_num + column_level_num
-    all_level_names: tp.List[tp.Hashable]
-    if orient == 'index':
-        all_level_names = index_level_names + column_level_names
-    elif orient == 'columns':
-        all_level_names = column_level_names + index_level_names
-    else:
+    if orient not in ('index', 'columns'):
         raise ValueError(
             '`orient` must be either "index" or "columns".'
         )
+    # The MultiIndex is always built with the index levels first, so that
+    # unstacking the column levels leaves them in canonical order.
+    all_level_names: tp.Tuple[tp.Hashable, ...] = \
+        (*index_level_names, *column_level_names)
+
+    # A plain dict of dicts maps directly onto a flat DataFrame, so skip the
+    # flattening and unstacking for that case.
+    if index_level_num == 1 and column_level_num == 1:
+        two_level_df: tp.Optional[pd.DataFrame] = _two_level_dict_to_df(
+            d,
+            orient
+        )
+        if two_level_df is not None:
+            return two_level_df.rename_axis(
+                index=index_level_names[0],
+                columns=column_level_names[0]
+            )
 
-    flat_df: pd.DataFrame = df_from_nested_dict(
-        d=d,
-        columns=all_level_names + ['___data___']
+    # Build a Series with a MultiIndex directly from the flattened keys, rather
+    # than going through a flat DataFrame and `set_index`.
+    keys: tp.List[tp.Tuple]
+    values: tp.List[tp.Any]
+    keys, values = _flatten_nested_dict(d)
+    if orient == 'columns':
+        keys = [
+            _key[column_level_num:] + _key[:column_level_num] for _key in keys
+        ]
+    data_series: pd.Series = pd.Series(
+        values,
+        index=pd.MultiIndex.from_tuples(keys, names=all_level_names)
+    )
+    indexed_df: pd.DataFrame = tp.cast(
+        pd.DataFrame,
+        data_series.unstack(list(range(index_level_num, total_level_num)))
     )
-
-    indexed_df: pd.DataFrame = flat_df.set_index(all_level_names).iloc[:, 0]
-    indexed_df = tp.cast(pd.DataFrame, indexed_df.unstack(column_level_names))
 
     return indexed_df
 ####END def dict_to_multi_df
 
 
+def _two_level_dict_to_df(
+    d: tp.Dict[tp.Hashable, tp.Any],
+    orient: tp.Literal['index', 'columns']
+) -> tp.Optional[pd.DataFrame]:
+    """Build the DataFrame for a two-level dict with `DataFrame.from_dict`.
+
+    Returns None if `d` is not a plain dict of dicts of scalars, or if the
+    result would differ from the one produced by unstacking a flattened Series
+    (i.e., if the columns end up with different dtypes, or the keys cannot be
+    sorted). The caller should then fall back to the general code path.
+    """
+    if len(d) == 0:
+        return None
+    _sample: tp.Any = next(iter(d.values()))
+    if not isinstance(_sample, dict) \
+            or any(isinstance(_v, dict) for _v in _sample.values()):
+        return None
+    df: pd.DataFrame = pd.DataFrame.from_dict(d, orient=orient)
+    # Unstacking gives a single dtype for all columns, so only use the result
+    # if from_dict has produced the same.
+    if df.dtypes.nunique() != 1:
+        return None
+    try:
+        df = df.sort_index(axis=0).sort_index(axis=1)
+    except TypeError:
+        return None
+    return df
+###END def _two_level_dict_to_df
+
+
 def df_from_nested_dict(
     d: tp.Dict[tp.Hashable, tp.Any],
     columns: tp.Sequence[tp.Hashable]
@@ -214,24 +312,57 @@ def df_from_nested_dict(
     -------
     pandas.DataFrame
     """
-    def _unnest(d: tp.Dict, keys: tp.List[tp.Hashable] = []) \
-            -> tp.List[tp.Tuple]:
-        result: tp.List[tp.Tuple] = []
-        for k, v in d.items():
-            if isinstance(v, dict):
-                result.extend(_unnest(v, keys+[k]))
-            else:
-                result.append(tuple(keys+[k, v]))
-        return result
-    flat_tuple_list: tp.List[tp.Tuple]= _unnest(d)
+    keys: tp.List[tp.Tuple]
+    values: tp.List[tp.Any]
+    keys, values = _flatten_nested_dict(d)
+    if not keys:
+        return pd.DataFrame(columns=columns)
+    # Build the DataFrame from one list per column rather than from a list of
+    # row tuples, which pandas would first convert to a 2D object array. The
+    # columns are keyed by position, so that duplicate names in `columns` are
+    # allowed, and named afterwards.
+    key_columns: tp.List[tp.Tuple] = list(zip(*keys))
     flat_df: pd.DataFrame = pd.DataFrame(
-        data=flat_tuple_list,
-        columns=columns
+        dict(enumerate([*key_columns, values]))
     )
+    flat_df.columns = pd.Index(columns)
     return flat_df
 ###END def df_from_nested_dict
 
 
+def _flatten_nested_dict(
+    d: tp.Dict[tp.Hashable, tp.Any]
+) -> tp.Tuple[tp.List[tp.Tuple], tp.List[tp.Any]]:
+    """Flatten a nested dict into a list of key tuples and a list of values.
+
+    Each key tuple holds the keys leading to a (non-dict) value in `d`, from
+    the outermost to the innermost level. The values are in the same order
+    as the key tuples, in depth-first order of `d`.
+    """
+    keys: tp.List[tp.Tuple] = []
+    values: tp.List[tp.Any] = []
+    # Traverse the nested dicts depth-first with an explicit stack rather
+    # than recursion. Each stack entry holds an iterator over the items of a
+    # dict, and the tuple of keys leading to that dict.
+    stack: tp.List[
+        tp.Tuple[tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]], tp.Tuple]
+    ] = [(iter(d.items()), ())]
+    _items: tp.Iterator[tp.Tuple[tp.Hashable, tp.Any]]
+    _keys: tp.Tuple
+    while stack:
+        _items, _keys = stack[-1]
+        for _key, _value in _items:
+            if isinstance(_value, dict):
+                stack.append((iter(_value.items()), _keys + (_key,)))
+                break
+            keys.append(_keys + (_key,))
+            values.append(_value)
+        else:
+            stack.pop()
+    return keys, values
+###END def _flatten_nested_dict
+
+
 def get_df_data(
     df: pd.DataFrame,
     name: tp.Hashable,
@@ -267,7 +398,8 @@ def get_df_data(
         the name of a column of `df`, the actual column will be returned, not
         a copy (unlike the case of an index or index level, in which case a
         new Series will be returned). Make a copy if you want to be sure to
-        avoid accidental changes to the original data.
+        avoid accidental changes to the original data. If `name` is both a
+        column name and an index or index level name, the column is returned.
 
     Raises
     ------
@@ -276,15 +408,23 @@ def get_df_data(
     """
     data_type: tp.Literal['index', 'indexlevel', 'column']
     data: pd.Series
-    if isinstance(df.index, pd.MultiIndex) and name in df.index.names:
-        data = df.index.get_level_values(name).to_series(name=name)
-        data_type = 'indexlevel'
-    elif df.index.name == name:
-        data = df.index.to_series(name=name)
-        data_type = 'index'
-    elif name in df.columns:
+    # Index data is wrapped with the `Series` constructor rather than
+    # `Index.to_series`, which always copies the values. With copy-on-write
+    # (default in pandas 3), the constructor shares the values with the index
+    # until either is modified, and on older pandas versions it copies.
+    # Columns are checked first, since that is the most common case and a
+    # single hashed lookup.
+    _index_data: pd.Index
+    if name in df.columns:
         data = tp.cast(pd.Series, df[name])
         data_type = 'column'
+    elif df.index.name == name:
+        data = pd.Series(df.index, index=df.index, name=name)
+        data_type = 'index'
+    elif isinstance(df.index, pd.MultiIndex) and name in df.index.names:
+        _index_data = df.index.get_level_values(name)
+        data = pd.Series(_index_data, index=_index_data, name=name)
+        data_type = 'indexlevel'
     else:
         raise KeyError(name)
 
@@ -375,43 +515,80 @@ def set_index_as_columns(
             '`include_levels` is None, should not be possible at this point in '
             'the code.'
         )
+    # Normalize `column_names` to a dict through a cached helper, since the
+    # function is often called repeatedly with the same arguments.
+    column_names_key: tp.Union[None, tp.Tuple]
+    column_names_is_dict: bool = False
     if column_names is None:
-        column_names = {_colname: _colname for _colname in include_levels}
+        column_names_key = None
     elif isinstance(column_names, str):
         raise TypeError(
             '`column_names` cannot be a single str when `df.index` is a '
             'MultiIndex.'
         )
     elif isinstance(column_names, tp.Sequence):
-        if len(column_names) != len(include_levels):
-            '`column_names` must be the same length as the number of included '
-            'index levels.'
-        column_names = {
-            _oldcol: _newcol
-            for _oldcol, _newcol in zip(include_levels, tuple(column_names))
-        }
-    elif not isinstance(column_names, tp.Dict):
+        column_names_key = tuple(column_names)
+    elif isinstance(column_names, tp.Dict):
+        column_names_key = tuple(column_names.items())
+        column_names_is_dict = True
+    else:
         raise TypeError(
             '`column_names` must be a sequence of str or a dict.'
         )
-    if not isinstance(column_names, tp.Dict):
-        raise RuntimeError(
-            '`column_names` should be a dict at this point but is not, '
-            'not clear why. Aborting!'
-        )
-    level_df: pd.DataFrame = ret_df.index.to_frame(index=True).loc[:, include_levels]
-    if any([_colname not in include_levels for _colname in column_names.keys()]):
-        raise ValueError(
-            '`column_names` includes names that are not present in included '
-            'index levels.'
-        )
-    level_df = level_df.rename(columns=column_names)
+    column_name_map: tp.Dict[tp.Hashable, str] = _normalize_column_names(
+        tuple(include_levels),
+        column_names_key,
+        column_names_is_dict
+    )
+    # Get only the included levels (rather than the whole index through
+    # `to_frame`), and insert them one by one into `ret_df`, which is already
+    # a shallow copy of `df`. This avoids both the extra copy made by `assign`
+    # and the block consolidation of concatenating with a separate DataFrame,
+    # and also allows level names that are not str.
+    for _level in include_levels:
+        ret_df[column_name_map.get(_level, _level)] = \
+            ret_df.index.get_level_values(_level).array
 
-    return pd.concat([ret_df, level_df], axis=1)
+    return ret_df
 
 ###END def set_index_as_columns
 
 
+@functools.lru_cache(maxsize=128)
+def _normalize_column_names(
+    include_levels: tp.Tuple[tp.Hashable, ...],
+    column_names: tp.Optional[tp.Tuple],
+    is_dict: bool
+) -> tp.Dict[tp.Hashable, str]:
+    """Returns a validated dict from index level names to column names for
+    `set_index_as_columns`.
+
+    `column_names` is either None, a tuple of column names in the same order
+    as `include_levels`, or (if `is_dict` is True) a tuple of the items of a
+    dict from level names to column names. The returned dict is cached, and
+    must not be modified by the caller.
+    """
+    if column_names is None:
+        return {_colname: _colname for _colname in include_levels}
+    if is_dict:
+        column_name_map: tp.Dict[tp.Hashable, str] = dict(column_names)
+        unknown_levels: tp.Set[tp.Hashable] = \
+            column_name_map.keys() - set(include_levels)
+        if unknown_levels:
+            raise ValueError(
+                '`column_names` includes names that are not present in '
+                f'included index levels: {unknown_levels}'
+            )
+        return column_name_map
+    if len(column_names) != len(include_levels):
+        raise ValueError(
+            '`column_names` must be the same length as the number of included '
+            'index levels.'
+        )
+    return dict(zip(include_levels, column_names))
+###END def _normalize_column_names
+
+
 def pdsel(
     pdobj: tp.Union[pd.DataFrame, pd.Series],
     _indexer_type: tp.Literal['label', 'index'] = 'label',
@@ -422,39 +599,37 @@ def pdsel(
     Returns
     -------
     pandas.DataFrame or pandas.Series
+        The selected rows of `pdobj`. If no keyword arguments are given,
+        `pdobj` itself is returned, not a copy.
     """
-    # First get indexers that are column names
-    col_indexers: tp.Dict
-    if isinstance(pdobj, pd.DataFrame):
-        col_indexers = {
-            _colname: _indexer for _colname, _indexer in kwargs.items()
-            if _colname in pdobj.columns
-        }
-    else:
-        col_indexers = {}
-    level_indexers: tp.Dict = {
-        _levelname: _indexer for _levelname, _indexer in kwargs.items()
-        if _levelname not in col_indexers.keys()
-    }
-    # Check that level_indexers are valid index levels, or empty if df.index is
-    # not a MultiIndex.
-    if level_indexers:
-        if not isinstance(pdobj.index, pd.MultiIndex):
+    # Sort the keyword arguments into indexers for columns and for index
+    # levels (which requires `pdobj.index` to be a MultiIndex) in a single
+    # pass, using sets of the column and level names for the lookups.
+    is_multiindex: bool = isinstance(pdobj.index, pd.MultiIndex)
+    column_names: tp.FrozenSet[tp.Hashable] = frozenset(pdobj.columns) \
+        if isinstance(pdobj, pd.DataFrame) else frozenset()
+    level_names: tp.FrozenSet[tp.Hashable] = frozenset(pdobj.index.names) \
+        if is_multiindex else frozenset()
+    col_indexers: tp.Dict = {}
+    level_indexers: tp.Dict = {}
+    for _name, _indexer in kwargs.items():
+        if _name in column_names:
+            col_indexers[_name] = _indexer
+        elif _name in level_names:
+            level_indexers[_name] = _indexer
+        elif not is_multiindex:
             raise ValueError(
                 'Keyword arguments contain keys that are not valid column names.'
             )
-        elif any(
-            [
-                _levelname not in pdobj.index.names
-                for _levelname in level_indexers.keys()
-            ]
-        ):
+        else:
             raise ValueError(
                 'Keyword arguments contain keys that are not valid index level '
                 'names.'
             )
 
-    filtered_obj: tp.Union[pd.DataFrame, pd.Series] = pdobj.copy(deep=False)
+    # No upfront copy is needed, since `.loc` and `.iloc` below return new
+    # objects whenever any filtering is done.
+    filtered_obj: tp.Union[pd.DataFrame, pd.Series] = pdobj
 
     # First select from the index. The .loc accessor will raise a KeyError if
     # any of the keys are not found, so selecting on the index first rather
@@ -467,21 +642,31 @@ def pdsel(
         )
         filtered_obj = filtered_obj.loc[multiindex_selector]
 
-    # Then filter the DataFrame by each column. Turn each column in
-    # turn into an index, get the indices for each, and use it to filter
-    # the DataFrame before repeating with the next column.
-    for _col, _selection in col_indexers.items():
-        tempindex: pd.Index = pd.Index(filtered_obj[_col])
-        indexer: tp.Union[slice, np.ndarray]
-        if isinstance(_selection, slice):
-            indexer = tempindex.slice_indexer(
-                start=_selection.start,
-                end=_selection.stop,
-                step=_selection.step
-            )
-        else:
-            indexer = tempindex.get_indexer_for(_selection)
-        filtered_obj = filtered_obj.iloc[indexer]
+    # Then filter the DataFrame by the columns. A boolean mask is made for
+    # each column, and the masks are combined so that the DataFrame is only
+    # filtered once. Rows keep their original order. Slices select a range of
+    # values, and require the column values to be sorted. Other selections
+    # are either a single value or a list-like of values.
+    if col_indexers:
+        mask: np.ndarray = np.ones(len(filtered_obj), dtype=bool)
+        _column: pd.Series
+        for _col, _selection in col_indexers.items():
+            _column = filtered_obj[_col]
+            if isinstance(_selection, slice):
+                _slice_mask: np.ndarray = np.zeros(len(_column), dtype=bool)
+                _slice_mask[
+                    pd.Index(_column).slice_indexer(
+                        start=_selection.start,
+                        end=_selection.stop,
+                        step=_selection.step
+                    )
+                ] = True
+                mask &= _slice_mask
+            elif pd.api.types.is_list_like(_selection):
+                mask &= _column.isin(_selection).to_numpy()
+            else:
+                mask &= _column.isin([_selection]).to_numpy()
+        filtered_obj = filtered_obj.iloc[mask]
 
     return filtered_obj
     
@@ -505,12 +690,24 @@ def make_multiindex_selector(
     if isinstance(pdobj, pd.DataFrame) or isinstance(pdobj, pd.Series):
         assert isinstance(pdobj.index, pd.MultiIndex)
         pdobj = pdobj.index
-    if any([_key not in pdobj.names for _key in kwargs.keys()]):
+    # Look up level positions in a dict rather than with `names.index`, which
+    # is a linear search for each keyword argument.
+    name_to_pos: tp.Dict[tp.Hashable, int] = {
+        _name: _pos for _pos, _name in enumerate(pdobj.names)
+    }
+    if not name_to_pos.keys() >= kwargs.keys():
         raise ValueError(
             'Passed keyword argument that is not an existing level name.'
         )
+    if len(kwargs) == 1:
+        ((_key, _selector),) = kwargs.items()
+        _key_pos: int = name_to_pos[_key]
+        return tuple(
+            _selector if _pos == _key_pos else slice(None)
+            for _pos in range(len(pdobj.names))
+        )
     selector: tp.List = [slice(None)] * len(pdobj.names)
     for _key, _selector in kwargs.items():
-        selector[pdobj.names.index(_key)] = _selector
+        selector[name_to_pos[_key]] = _selector
     return tuple(selector)
 ###END def make_multiindex_selector
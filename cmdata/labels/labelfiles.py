@@ -65,7 +65,7 @@ class LabelfileManager:
 
     def read_labelsets(self) -> tp.Mapping[str, tp.List[tp.Hashable]]:
         return {
-            _key: list(helpers.yaml_utils.read_yaml(_file).keys())
+            _key: list(helpers.yaml_utils.read_yaml_cached(_file).keys())
             for _key, _file in self.yamlfiles.items()
         }
     ###END def LabelfileManager.read_labelsets
@@ -6,7 +6,8 @@ import io
 
 import pandas as pd
 import numpy as np
-import ruamel.yaml as yaml
+
+from .. import helpers
 
 
 class LabelMap:
@@ -214,9 +215,13 @@ class LabelMap:
         -------
         LabelMap
         """
-        yamlstream: tp.TextIO
-        with open(yamlfile, mode='r') as yamlstream:
-            _def: tp.Dict[tp.Hashable, tp.Any] = yaml.safe_load(yamlstream)
+        # Files are parsed once and cached, since they are typically read
+        # repeatedly (once to list the label sets, and once per label set).
+        _def: tp.Dict[tp.Hashable, tp.Any]
+        if isinstance(yamlfile, (str, Path)):
+            _def = helpers.yaml_utils.read_yaml_cached(yamlfile)
+        else:
+            _def = helpers.yaml_utils.safe_load(yamlfile)
         if key:
             if isinstance(key, tp.Hashable):
                 _def = _def[key]
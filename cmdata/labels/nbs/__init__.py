@@ -39,7 +39,7 @@ yamlfiles: tp.Dict[str, Path] = FrozenDict(
 
 labelsets: FrozenDict = FrozenDict(
     # {_key: list(_yamldict.keys()) for _key, _yamldict in helpers.yaml_utils.read_yaml(yamlfiles.items())}
-    {_key: list(helpers.yaml_utils.read_yaml(_file).keys())
+    {_key: list(helpers.yaml_utils.read_yaml_cached(_file).keys())
      for _key, _file in yamlfiles.items()}
 )
 """Label set identifiers in each NBS label definition file."""
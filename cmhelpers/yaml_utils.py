@@ -1,21 +1,60 @@
 """Utilities for processing yaml files."""
 import typing as tp
 from pathlib import Path
+import os
+import copy
+import functools
 
 import ruamel.yaml as yaml
 
 from .stream_utils import file_or_stream
 
 
+_safe_yaml: yaml.YAML = yaml.YAML(typ='safe', pure=False)
+"""ruamel.yaml instance used by `safe_load`. Uses the libyaml-based C loader
+if `ruamel.yaml.clib` is installed, and the pure Python loader otherwise."""
+
+
+def safe_load(
+    stream: tp.Union[str, tp.IO],
+    version: tp.Optional[tp.Union[str, tp.Tuple[int, int]]] = None
+) -> tp.Any:
+    """Load YAML with the ruamel.yaml safe loader, using the C loader if
+    available.
+
+    Replacement for `ruamel.yaml.safe_load`, which always uses the pure Python
+    loader (and is deprecated in recent ruamel.yaml versions).
+
+    Parameters
+    ----------
+    stream : str or io stream
+        The YAML document(s) to load.
+    version : str or tuple of int, optional
+        YAML version to assume if the document does not specify one.
+        Optional, by default uses the ruamel.yaml default (1.2).
+
+    Returns
+    -------
+    The loaded data
+    """
+    if version is None:
+        return _safe_yaml.load(stream)
+    _yaml: yaml.YAML = yaml.YAML(typ='safe', pure=False)
+    _yaml.version = version
+    return _yaml.load(stream)
+###END def safe_load
+
+
 def read_yaml(
     file: tp.Union[str, Path, tp.TextIO],
-    yaml_load_func: tp.Callable[[tp.IO], dict] = yaml.safe_load,
+    yaml_load_func: tp.Callable[[tp.IO], dict] = safe_load,
     **kwargs
 ) -> tp.Dict[tp.Hashable, tp.Any]:
     """Read contents of a YAML file, with no further processing.
     
-    By default uses the `safe_load` function from `ruamel.yaml` (i.e., expects
-    YAML version 1.2 by default).
+    By default uses `safe_load` from this module, i.e., the `ruamel.yaml` safe
+    loader (which expects YAML version 1.2 by default), with the C loader if
+    available.
     
     Parameters
     ----------
@@ -32,4 +71,44 @@ def read_yaml(
     with file_or_stream(file) as f:
         yaml_content = yaml_load_func(f, **kwargs)
     return yaml_content
-###END def read_yaml
\ No newline at end of file
+###END def read_yaml
+
+
+def read_yaml_cached(
+    file: tp.Union[str, Path]
+) -> tp.Dict[tp.Hashable, tp.Any]:
+    """Read contents of a YAML file, parsing each file only once per process.
+
+    The parsed contents are cached on the absolute path, modification time and
+    size of the file, so the file is parsed again if it changes. Uses
+    `safe_load` with default parameters.
+
+    Parameters
+    ----------
+    file : str or Path
+        The YAML file to read
+
+    Returns
+    -------
+    dict
+        A deep copy of the cached contents, which can be modified freely.
+    """
+    path: str = os.path.abspath(file)
+    file_stat: os.stat_result = os.stat(path)
+    return copy.deepcopy(
+        _read_yaml_cached(path, file_stat.st_mtime_ns, file_stat.st_size)
+    )
+###END def read_yaml_cached
+
+
+@functools.lru_cache(maxsize=64)
+def _read_yaml_cached(
+    path: str,
+    mtime_ns: int,
+    size: int
+) -> tp.Dict[tp.Hashable, tp.Any]:
+    """Cached reader used by `read_yaml_cached`. `mtime_ns` and `size` are
+    only used as part of the cache key."""
+    with open(path, mode='rb') as f:
+        return safe_load(f)
+###END def _read_yaml_cached
@@ -0,0 +1,113 @@
+"""Tests for `cmdata.dataload.configparsers`."""
+import configparser
+import os
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from cmdata.dataload.configparsers import PathConfigParser
+
+
+class PathConfigParserReadTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _write(self, name: str, contents: str) -> Path:
+        path = self.tmp_path / name
+        path.write_text(contents)
+        return path
+
+    def test_lone_percent_is_read_raw(self):
+        path = self._write('percent.ini', '[s]\nx = 50%\n')
+        parser = PathConfigParser()
+        parser.read(path)
+        self.assertEqual(parser.get('s', 'x', raw=True), '50%')
+        with self.assertRaises(configparser.InterpolationSyntaxError):
+            parser.get('s', 'x')
+
+    def test_matches_configparser_read(self):
+        contents = (
+            '[DEFAULT]\nBase = base\n\n'
+            '[First]\nKey = %(base)s/value\nmulti = line1\n    line2\n\n'
+            '[second]\nother = 1\n'
+        )
+        path = self._write('data.ini', contents)
+        update_path = self._write('update.ini', '[First]\nkey = new\n')
+        parser = PathConfigParser(root_path=self.tmp_path)
+        parser.read(path)
+        parser.read(update_path)
+        expected = configparser.ConfigParser()
+        expected.read([path, update_path])
+        self.assertEqual(parser.sections(), expected.sections())
+        for section in expected.sections():
+            self.assertEqual(
+                dict(parser.items(section)),
+                {
+                    **dict(expected.items(section)),
+                    'root_path': str(self.tmp_path)
+                }
+            )
+
+    def test_duplicate_options_differing_in_case_raise(self):
+        path = self._write('dup.ini', '[s]\nKey = 1\nkey = 2\n')
+        with self.assertRaises(configparser.DuplicateOptionError):
+            PathConfigParser().read(path)
+
+    def test_custom_optionxform_and_section_regex(self):
+        path = self._write('custom.ini', '<s>\nKey = 1\n')
+
+        class _Parser(PathConfigParser):
+            SECTCRE = re.compile(r'<(?P<header>[^>]+)>')
+
+            def optionxform(self, optionstr):
+                return optionstr.upper()
+
+        parser = _Parser()
+        parser.read(path)
+        self.assertEqual(parser.get('s', 'KEY'), '1')
+        case_parser = PathConfigParser()
+        case_parser.optionxform = str
+        case_parser.read(self._write('case.ini', '[s]\nKey = 1\n'))
+        self.assertEqual(list(case_parser['s']), ['Key', 'root_path'])
+
+    def test_default_root_path_is_file_directory(self):
+        path = self._write('root.ini', '[s]\nx = 1\n')
+        parser = PathConfigParser()
+        parser.read(path)
+        self.assertEqual(
+            parser.root_path,
+            Path(os.path.dirname(os.path.abspath(path)))
+        )
+
+###END class PathConfigParserReadTest
+
+
+class ConfigParserListMixinTest(unittest.TestCase):
+
+    def test_getlistiter_does_not_cache_stale_list(self):
+        parser = PathConfigParser()
+        parser.read_string('[s]\nx = a\n    b\n    c\n')
+        items = parser.getlistiter('s', 'x')
+        self.assertEqual(next(items), 'a')
+        parser.set('s', 'x', 'q\nr')
+        self.assertEqual(list(items), ['b', 'c'])
+        self.assertEqual(parser.getlist('s', 'x'), ['q', 'r'])
+
+    def test_getlistiter_caches_exhausted_list(self):
+        parser = PathConfigParser()
+        parser.read_string('[s]\nx = a\n    b\n')
+        self.assertEqual(list(parser.getlistiter('s', 'x')), ['a', 'b'])
+        self.assertEqual(len(parser._list_cache), 1)
+        self.assertEqual(parser.getlist('s', 'x'), ['a', 'b'])
+
+###END class ConfigParserListMixinTest
+
+
+if __name__ == '__main__':
+    unittest.main()
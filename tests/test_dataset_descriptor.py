@@ -0,0 +1,87 @@
+"""Tests for `cmdata.datadesc.dataset_descriptor`."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from cmdata.datadesc.dataset_descriptor import (
+    DescriptorBase,
+    DatasetDescriptorBase,
+)
+
+
+DESCRIPTORS_YAML: str = '''\
+datasets:
+  - id: a
+    name: Dataset A
+    raw_data_path: data/a.csv
+    dimensions: [time, region]
+    extra_key: 1
+  - id: b
+    parent_id: a
+    raw_data_path:
+      v1: data/b1.csv
+      v2: data/b2.csv
+    default_version: v2
+'''
+
+
+class DictFromYamlTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.yaml_path = Path(self._tmpdir.name) / 'descriptors.yaml'
+        self.yaml_path.write_text(DESCRIPTORS_YAML)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_extra_keys_are_ignored(self):
+        for validate in (False, True):
+            with self.subTest(validate=validate):
+                descriptors = DescriptorBase.dict_from_yaml(
+                    self.yaml_path,
+                    validate=validate,
+                    cache_dir=False
+                )
+                self.assertEqual(descriptors['a'].id, 'a')
+                self.assertEqual(descriptors['a_b'].parent_id, 'a')
+
+    def test_validated_and_unvalidated_descriptors_are_equal(self):
+        unvalidated = DatasetDescriptorBase.dict_from_yaml(
+            self.yaml_path,
+            cache_dir=False
+        )
+        validated = DatasetDescriptorBase.dict_from_yaml(
+            self.yaml_path,
+            validate=True,
+            cache_dir=False
+        )
+        self.assertEqual(unvalidated, validated)
+        self.assertEqual(unvalidated['a'].dimensions, ('time', 'region'))
+        self.assertIsInstance(unvalidated['a'].raw_data_path, Path)
+        hash(unvalidated['a'])
+
+    def test_with_base_path_does_not_modify_cached_descriptors(self):
+        descriptors = DatasetDescriptorBase.dict_from_yaml(
+            self.yaml_path,
+            cache_dir=False
+        )
+        prefixed = descriptors['a'].with_base_path('/base')
+        self.assertEqual(prefixed.raw_data_path, Path('/base/data/a.csv'))
+        with self.assertRaises(ValueError):
+            descriptors['a'].with_base_path('/base', inplace=True)
+        reread = DatasetDescriptorBase.dict_from_yaml(
+            self.yaml_path,
+            cache_dir=False
+        )
+        self.assertEqual(reread['a'].raw_data_path, Path('data/a.csv'))
+        self.assertEqual(
+            reread['a_b'].raw_data_path,
+            {'v1': Path('data/b1.csv'), 'v2': Path('data/b2.csv')}
+        )
+
+###END class DictFromYamlTest
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for `cmdata.datadesc.yamlfuncs`."""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cmdata.datadesc import yamlfuncs
+
+
+class LoadParsedYamlTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.yaml_path = self.tmp_path / 'data.yaml'
+        self.yaml_path.write_text('a: 1\nb: x\n')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_default_cache_dir_is_resolved_at_call_time(self):
+        cache_home = self.tmp_path / 'cache'
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(cache_home)}):
+            data = yamlfuncs.load_parsed_yaml(self.yaml_path)
+            self.assertEqual(yamlfuncs.load_parsed_yaml(self.yaml_path), data)
+        self.assertEqual(data, {'a': 1, 'b': 'x'})
+        self.assertEqual(len(list((cache_home / 'cmdata').iterdir())), 1)
+
+    def test_cache_can_be_disabled(self):
+        cache_home = self.tmp_path / 'cache'
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(cache_home)}):
+            yamlfuncs.load_parsed_yaml(self.yaml_path, cache_dir=False)
+        self.assertFalse(cache_home.exists())
+
+    def test_cache_key_depends_on_code_version(self):
+        cache_dir = self.tmp_path / 'cache'
+        yamlfuncs.load_parsed_yaml(self.yaml_path, cache_dir=cache_dir)
+        with mock.patch.object(
+                yamlfuncs, '_code_version', return_value='changed'
+        ):
+            yamlfuncs.load_parsed_yaml(self.yaml_path, cache_dir=cache_dir)
+        self.assertEqual(len(list(cache_dir.iterdir())), 2)
+
+###END class LoadParsedYamlTest
+
+
+if __name__ == '__main__':
+    unittest.main()